@@ -1,11 +1,40 @@
 #!/usr/bin/env python3
+import asyncio
+import fcntl
 import grp
+import http.client
 import json
+import mmap
 import os
-import socketserver
-import subprocess
+import re
+import select
+import shutil
+import signal
+import socket
+import struct
+import sys
+import termios
+import threading
+import time
+import traceback
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
+from urllib.parse import urlencode
+
+try:
+    from pystemd.dbuslib import DBus
+    from pystemd.systemd1 import Manager
+
+    _HAS_PYSTEMD = True
+except ImportError:
+    _HAS_PYSTEMD = False
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -13,6 +42,48 @@ DEFAULT_CONFIG_PATH = BASE_DIR / "config.json"
 DEFAULT_SOCKET_PATH = Path("/run/rc-control/helper.sock")
 DEFAULT_SOCKET_GROUP = "tewelde"
 DEFAULT_MAX_BODY_BYTES = 16384
+DEFAULT_STATUS_TTL_MS = 2000
+DEFAULT_MAX_OUTPUT_BYTES = 262144
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+ACTION_TIMEOUT_SECONDS = 45
+STATUS_TIMEOUT_SECONDS = 3
+SYSTEMD_BUS_METHODS = {"start": "StartUnit", "stop": "StopUnit", "restart": "RestartUnit"}
+SYSTEMD_BUS_NAME = b"org.freedesktop.systemd1"
+SYSTEMD_BUS_PATH = b"/org/freedesktop/systemd1"
+SYSTEMD_MANAGER_INTERFACE = b"org.freedesktop.systemd1.Manager"
+# JobRemoved results systemctl itself reports as success.
+SYSTEMD_JOB_OK_RESULTS = frozenset({"done", "skipped"})
+SYSTEMD_PROCESS_BATCH = 64
+SYSTEMD_UNIT_SUFFIXES = (
+    ".service",
+    ".socket",
+    ".target",
+    ".timer",
+    ".mount",
+    ".automount",
+    ".path",
+    ".slice",
+    ".scope",
+    ".swap",
+    ".device",
+)
+DOCKER_PS_FORMAT = "{{.Names}}\t{{.Status}}\t{{.Image}}\t{{.Ports}}"
+RAW_PIPE_BYTES = 1 << 20
+# Framed requests carry a 4-byte big-endian length. Bodies are clamped to
+# MAX_FRAME_BODY_BYTES (< 16 MiB), so the first byte is always NUL and never collides
+# with legacy newline-delimited JSON; raising the clamp would break that sniff.
+FRAME_HEADER = struct.Struct("!I")
+MAX_FRAME_BODY_BYTES = (1 << 24) - 1
+RECV_BYTES = 65536
+STATUS_GENERATION = struct.Struct("=Q")
+
+_OP_STATUS_MAP = sys.intern("container_status_map")
+_OP_STATUS_RAW = sys.intern("container_status_raw")
+_OP_STATUS_TSV = sys.intern("container_status_tsv")
+_OP_SERVICE = sys.intern("service_action")
+_OP_CONTAINER = sys.intern("container_action")
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
 
 def env_int(name: str, default_value: int) -> int:
@@ -25,170 +96,613 @@ def env_int(name: str, default_value: int) -> int:
         return default_value
 
 
+def dump_json_bytes(payload: Any) -> bytes:
+    if _HAS_ORJSON:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return _JSON_ENCODER.encode(payload).encode("utf-8")
+
+
+def load_json_bytes(blob: bytes | bytearray) -> Any:
+    if _HAS_ORJSON:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
 def read_json_file(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-    data = json.loads(path.read_text(encoding="utf-8"))
+    try:
+        data = load_json_bytes(path.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
     if not isinstance(data, dict):
         raise ValueError("Config file must contain a JSON object.")
     return data
 
 
-def run_cmd(command: list[str], timeout: int = 20) -> dict[str, Any]:
+MAX_OUTPUT_BYTES = max(4096, env_int("RC_HELPER_MAX_OUTPUT_BYTES", DEFAULT_MAX_OUTPUT_BYTES))
+
+
+async def read_capped(stream: asyncio.StreamReader | None, cap: int = MAX_OUTPUT_BYTES) -> bytes:
+    # Keep draining past the cap so a chatty child never blocks on a full pipe.
+    if stream is None:
+        return b""
+    buf = bytearray()
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            return bytes(buf)
+        if len(buf) < cap:
+            buf += chunk[: cap - len(buf)]
+
+
+async def run_cmd(command: Sequence[str], timeout: int = 20, binary: bool = False) -> dict[str, Any]:
     try:
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
+        # Helper fds are all close-on-exec, so close_fds=False is safe and lets
+        # subprocess take its posix_spawn path for absolute executables.
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,
         )
+    except Exception as ex:  # noqa: BLE001
         return {
-            "ok": proc.returncode == 0,
-            "return_code": proc.returncode,
-            "stdout": (proc.stdout or "").strip(),
-            "stderr": (proc.stderr or "").strip(),
+            "ok": False,
+            "return_code": -1,
+            "stdout": b"" if binary else "",
+            "stderr": str(ex),
         }
-    except subprocess.TimeoutExpired:
+    try:
+        stdout, stderr, _ = await asyncio.wait_for(
+            asyncio.gather(read_capped(proc.stdout), read_capped(proc.stderr), proc.wait()),
+            timeout=timeout,
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
         return {
             "ok": False,
             "return_code": -1,
-            "stdout": "",
+            "stdout": b"" if binary else "",
             "stderr": f"Command timed out after {timeout}s",
         }
-    except Exception as ex:  # noqa: BLE001
+    return {
+        "ok": proc.returncode == 0,
+        "return_code": proc.returncode,
+        "stdout": stdout if binary else stdout.decode("utf-8", errors="replace").strip(),
+        "stderr": stderr.decode("utf-8", errors="replace").strip(),
+    }
+
+
+async def wait_fd(fd: int, writable: bool = False) -> None:
+    loop = asyncio.get_running_loop()
+    ready: asyncio.Future[None] = loop.create_future()
+
+    def wake() -> None:
+        if not ready.done():
+            ready.set_result(None)
+
+    if writable:
+        loop.add_writer(fd, wake)
+    else:
+        loop.add_reader(fd, wake)
+    try:
+        await ready
+    finally:
+        if writable:
+            loop.remove_writer(fd)
+        else:
+            loop.remove_reader(fd)
+
+
+async def stream_pipe_frames(read_fd: int, conn: socket.socket, deadline: float) -> None:
+    # Forward pipe data as length-prefixed frames while the writer is still running;
+    # a readable pipe with nothing buffered means every writer has closed it.
+    # The deadline only bounds waits for the pipe, so a timeout never lands mid-frame.
+    loop = asyncio.get_running_loop()
+    available = bytearray(4)
+    while True:
+        await asyncio.wait_for(wait_fd(read_fd), max(0.0, deadline - loop.time()))
+        fcntl.ioctl(read_fd, termios.FIONREAD, available)
+        length = int.from_bytes(available, sys.byteorder)
+        if length == 0:
+            return
+        await loop.sock_sendall(conn, FRAME_HEADER.pack(length))
+        if not hasattr(os, "splice"):
+            await loop.sock_sendall(conn, os.read(read_fd, length))
+            continue
+        while length > 0:
+            try:
+                moved = os.splice(read_fd, conn.fileno(), length)
+            except BlockingIOError:
+                await wait_fd(conn.fileno(), writable=True)
+                continue
+            if moved == 0:
+                raise ConnectionError("Raw status pipe closed early.")
+            length -= moved
+
+
+def resolve_binary(name: str, required: bool) -> str:
+    path = shutil.which(name) or f"/usr/bin/{name}"
+    if required and not os.access(path, os.X_OK):
+        raise RuntimeError(f"Required command '{name}' not found on PATH or at {path}")
+    return path
+
+
+def format_ports(ports: Any) -> str:
+    if not isinstance(ports, list):
+        return ""
+    out: list[str] = []
+    for port in ports:
+        if not isinstance(port, dict):
+            continue
+        private = f"{port.get('PrivatePort', '')}/{port.get('Type', 'tcp')}"
+        public = port.get("PublicPort")
+        if public:
+            ip = str(port.get("IP", "") or "")
+            if ":" in ip:
+                ip = f"[{ip}]"
+            out.append(f"{ip}:{public}->{private}")
+        else:
+            out.append(private)
+    return ", ".join(out)
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("docker", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class DockerEngineClient:
+    def __init__(self, socket_path: str, timeout: float = 10.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._conn: UnixHTTPConnection | None = None
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        try:
+            return Path(self.socket_path).is_socket()
+        except OSError:
+            return False
+
+    def _reset(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get_json(self, path: str) -> Any:
+        with self._lock:
+            for attempt in range(2):
+                if self._conn is None:
+                    self._conn = UnixHTTPConnection(self.socket_path, self.timeout)
+                try:
+                    self._conn.request("GET", path)
+                    resp = self._conn.getresponse()
+                    body = resp.read()
+                except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                    # Keep-alive connection went stale between polls; reconnect once.
+                    self._reset()
+                    if attempt:
+                        raise
+                    continue
+                except Exception:
+                    self._reset()
+                    raise
+                if resp.will_close:
+                    self._reset()
+                if resp.status != 200:
+                    raise RuntimeError(f"Docker API {path} returned HTTP {resp.status}: {body[:200]!r}")
+                return load_json_bytes(body)
+        raise RuntimeError("Docker API request failed.")
+
+
+class SystemdBusClient:
+    """Runs unit jobs over one long-lived system bus connection (requires pystemd)."""
+
+    def __init__(self):
+        self._bus: Any = None
+        self._manager: Any = None
+        # Guards every use of the bus; held only for method calls and short
+        # process() rounds so concurrent actions are not serialised on a wait.
+        self._lock = threading.Lock()
+        self._job_results: dict[bytes, bytes | None] = {}
+
+    @staticmethod
+    def unit_name(target: str) -> str:
+        return target if target.endswith(SYSTEMD_UNIT_SUFFIXES) else f"{target}.service"
+
+    def _connect(self) -> None:
+        # Opened lazily so every forked worker gets its own bus connection.
+        if self._manager is None:
+            bus = DBus()
+            bus.open()
+            bus.match_signal(
+                SYSTEMD_BUS_NAME,
+                SYSTEMD_BUS_PATH,
+                SYSTEMD_MANAGER_INTERFACE,
+                b"JobRemoved",
+                self._on_job_removed,
+            )
+            manager = Manager(bus=bus, _autoload=True)
+            manager.Manager.Subscribe()
+            self._bus = bus
+            self._manager = manager
+
+    def _reset(self) -> None:
+        if self._bus is not None:
+            try:
+                self._bus.close()
+            except Exception:  # noqa: BLE001
+                pass
+        self._bus = None
+        self._manager = None
+        self._job_results.clear()
+
+    def _on_job_removed(self, msg: Any, error: Any = None, userdata: Any = None) -> None:
+        # JobRemoved(u id, o job, s unit, s result); only jobs we queued are tracked.
+        msg.process_reply(False)
+        _job_id, job_path, _unit, result = msg.body
+        if job_path in self._job_results:
+            self._job_results[job_path] = result
+
+    def _poll_job(self, job_path: bytes) -> bytes | None:
+        with self._lock:
+            if self._bus is None:
+                raise RuntimeError("System bus connection was reset.")
+            # Bounded so one busy bus cannot pin the lock for other actions.
+            for _ in range(SYSTEMD_PROCESS_BATCH):
+                drained = self._bus.process().is_empty()
+                if self._job_results.get(job_path) is not None or drained:
+                    break
+            return self._job_results.get(job_path)
+
+    def run_action(self, action: str, target: str, timeout: int) -> dict[str, Any]:
+        unit_name = self.unit_name(target)
+        with self._lock:
+            try:
+                self._connect()
+                job_path = getattr(self._manager.Manager, SYSTEMD_BUS_METHODS[action])(
+                    unit_name.encode(), b"replace"
+                )
+                self._job_results[job_path] = None
+                fd = self._bus.get_fd()
+            except Exception as ex:  # noqa: BLE001
+                self._reset()
+                return _error(str(ex))
+
+        # systemctl blocks until the queued job finishes; keep that behavior and
+        # take the outcome from the job itself rather than the unit's state.
+        deadline = time.monotonic() + timeout
+        try:
+            while (result := self._poll_job(job_path)) is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return _error(f"Command timed out after {timeout}s")
+                select.select([fd], [], [], min(remaining, 0.25))
+        except Exception as ex:  # noqa: BLE001
+            with self._lock:
+                self._reset()
+            return _error(str(ex))
+        finally:
+            with self._lock:
+                self._job_results.pop(job_path, None)
+
+        result_text = result.decode("utf-8", errors="replace")
+        ok = result_text in SYSTEMD_JOB_OK_RESULTS
         return {
-            "ok": False,
-            "return_code": -1,
+            "ok": ok,
+            "return_code": 0 if ok else 1,
             "stdout": "",
-            "stderr": str(ex),
+            "stderr": "" if ok else f"Job for {unit_name} finished with result '{result_text}'.",
         }
 
 
+def _field(req: dict[str, Any], name: str) -> str:
+    value = req.get(name)
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _error(message: str) -> dict[str, Any]:
+    return {"ok": False, "return_code": -1, "stdout": "", "stderr": message}
+
+
+def _encode_response(payload: dict[str, Any] | bytes) -> bytes:
+    if isinstance(payload, bytes):
+        return payload
+    return dump_json_bytes(payload) + b"\n"
+
+
+_ERR_TOO_LARGE = _encode_response(_error("Request body too large."))
+_ERR_INVALID_JSON = _encode_response(_error("Invalid JSON payload."))
+_ERR_NOT_OBJECT = _encode_response(_error("Payload must be an object."))
+_ERR_UNSUPPORTED = _encode_response(_error("Unsupported operation."))
+_ERR_TARGET_REQUIRED = _encode_response(_error("Target is required."))
+# container_status_raw replies with this line, FRAME_HEADER-prefixed chunks of docker ps
+# output, a zero-length frame, and then a JSON status line.
+_RAW_TSV_HEADER = _encode_response({"ok": True, "format": "tsv", "framing": "frames"})
+
+
 class PrivilegedApi:
     def __init__(self):
         config_path = Path(os.environ.get("RC_CONFIG_PATH", str(DEFAULT_CONFIG_PATH))).resolve()
         self.config_path = config_path
         self.config = read_json_file(config_path)
+        self._services = self._string_set(self.config.get("targets", {}).get("services", []))
+        self._containers = self._string_set(self.config.get("targets", {}).get("containers", []))
+        self._service_actions = self._string_set(self.config.get("actions", {}).get("service", []))
+        self._container_actions = self._string_set(self.config.get("actions", {}).get("container", []))
+        self._status_ttl = max(0, env_int("RC_HELPER_STATUS_TTL_MS", DEFAULT_STATUS_TTL_MS)) / 1000.0
+        # Bumped by container actions; a fetch that started under an older generation
+        # is neither cached nor joined by later callers. The counter lives in a shared
+        # anonymous mapping created before fork, so an action in one worker invalidates all.
+        self._status_generation = mmap.mmap(-1, STATUS_GENERATION.size)
+        self._status_cache: tuple[float, int, dict[str, Any]] | None = None
+        self._status_inflight: tuple[int, asyncio.Future[dict[str, Any]]] | None = None
+        self._systemctl = resolve_binary("systemctl", required=bool(self._services))
+        self._docker = resolve_binary("docker", required=bool(self._containers))
+        self._systemd_bus = SystemdBusClient() if _HAS_PYSTEMD else None
+        include_stopped = self.config.get("targets", {}).get("include_stopped_containers", True) is not False
+        name_filters = [f"^{re.escape(name)}$" for name in sorted(self._containers)]
+        ps_args = ["ps", "-a"] if include_stopped else ["ps"]
+        for pattern in name_filters:
+            ps_args += ["--filter", f"name={pattern}"]
+        self._docker_ps = (self._docker, *ps_args, "--format", DOCKER_PS_FORMAT)
+        list_query = {"all": "1" if include_stopped else "0"}
+        if name_filters:
+            list_query["filters"] = json.dumps({"name": name_filters}, separators=(",", ":"))
+        self._docker_list_path = "/containers/json?" + urlencode(list_query)
+        self._docker_api = DockerEngineClient(
+            os.environ.get("RC_HELPER_DOCKER_SOCKET", DEFAULT_DOCKER_SOCKET), timeout=STATUS_TIMEOUT_SECONDS
+        )
 
-    def _configured_services(self) -> set[str]:
-        raw = self.config.get("targets", {}).get("services", [])
+    @staticmethod
+    def _string_set(raw: Any) -> frozenset[str]:
         if not isinstance(raw, list):
-            return set()
-        return {str(x).strip() for x in raw if str(x).strip()}
+            return frozenset()
+        return frozenset(txt for txt in (str(x).strip() for x in raw) if txt)
+
+    def _current_generation(self) -> int:
+        return STATUS_GENERATION.unpack_from(self._status_generation)[0]
+
+    def _invalidate_status(self) -> None:
+        # Not atomic across workers, but any change of value is enough to invalidate.
+        STATUS_GENERATION.pack_into(self._status_generation, 0, self._current_generation() + 1)
+        self._status_cache = None
+        self._status_inflight = None
+
+    def _cached_status(self, generation: int) -> dict[str, Any] | None:
+        cached = self._status_cache
+        if cached is not None and cached[1] == generation and time.monotonic() - cached[0] < self._status_ttl:
+            return cached[2]
+        return None
+
+    async def _container_status_map(self) -> dict[str, Any]:
+        generation = self._current_generation()
+        cached = self._cached_status(generation)
+        if cached is not None:
+            return cached
+        inflight = self._status_inflight
+        if inflight is not None and inflight[0] == generation:
+            return await asyncio.shield(inflight[1])
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._status_inflight = (generation, future)
+        try:
+            out = await self._fetch_container_status_map()
+        except Exception as ex:  # noqa: BLE001
+            out = _error(str(ex))
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            if self._status_inflight is not None and self._status_inflight[1] is future:
+                self._status_inflight = None
+        if out["ok"] and generation == self._current_generation():
+            self._status_cache = (time.monotonic(), generation, out)
+        future.set_result(out)
+        return out
 
-    def _configured_containers(self) -> set[str]:
-        raw = self.config.get("targets", {}).get("containers", [])
-        if not isinstance(raw, list):
-            return set()
-        return {str(x).strip() for x in raw if str(x).strip()}
+    async def _fetch_container_status_map(self) -> dict[str, Any]:
+        if not self._docker_api.available():
+            return await self._fetch_container_status_map_cli()
+        try:
+            containers = await asyncio.to_thread(self._docker_api.get_json, self._docker_list_path)
+        except Exception as ex:  # noqa: BLE001
+            return _error(f"Docker API request failed: {ex}")
+        if not isinstance(containers, list):
+            return _error("Docker API returned an unexpected container list.")
+        result: dict[str, dict[str, str]] = {}
+        for item in containers:
+            names = item.get("Names") if isinstance(item, dict) else None
+            if not names:
+                continue
+            result[str(names[0]).lstrip("/")] = {
+                "status": str(item.get("Status", "")),
+                "image": str(item.get("Image", "")),
+                "ports": format_ports(item.get("Ports")),
+            }
+        return {"ok": True, "return_code": 0, "stdout": "", "stderr": "", "containers": result}
 
-    def _allowed_actions(self, target_type: str) -> set[str]:
-        raw = self.config.get("actions", {}).get(target_type, [])
-        if not isinstance(raw, list):
-            return set()
-        return {str(x).strip() for x in raw if str(x).strip()}
-
-    def _container_status_map(self) -> dict[str, Any]:
-        out = run_cmd(
-            [
-                "docker",
-                "ps",
-                "-a",
-                "--format",
-                "{{.Names}}\t{{.Status}}\t{{.Image}}\t{{.Ports}}",
-            ]
-        )
+    async def _fetch_container_status_map_cli(self) -> dict[str, Any]:
+        out = await run_cmd(self._docker_ps, timeout=STATUS_TIMEOUT_SECONDS, binary=True)
+        stdout: bytes = out["stdout"]
         if not out["ok"]:
+            out["stdout"] = stdout.decode("utf-8", errors="replace").strip()
             return out
         result: dict[str, dict[str, str]] = {}
-        for line in out["stdout"].splitlines():
-            parts = line.split("\t")
+        for line in stdout.split(b"\n"):
+            parts = line.split(b"\t", 3)
             if len(parts) < 4:
                 continue
-            result[parts[0]] = {
-                "status": parts[1],
-                "image": parts[2],
-                "ports": parts[3],
+            result[parts[0].decode("utf-8", errors="replace")] = {
+                "status": parts[1].decode("utf-8", errors="replace"),
+                "image": parts[2].decode("utf-8", errors="replace"),
+                "ports": parts[3].decode("utf-8", errors="replace"),
             }
+        out["stdout"] = ""
         out["containers"] = result
         return out
 
-    def execute(self, req: dict[str, Any]) -> dict[str, Any]:
-        op = str(req.get("op", "")).strip()
-        action = str(req.get("action", "")).strip()
-        target = str(req.get("target", "")).strip()
-
-        if op == "container_status_map":
-            return self._container_status_map()
-
-        if op not in {"service_action", "container_action"}:
-            return {"ok": False, "return_code": -1, "stdout": "", "stderr": "Unsupported operation."}
-        if not target:
-            return {"ok": False, "return_code": -1, "stdout": "", "stderr": "Target is required."}
+    async def _container_status_tsv(self) -> dict[str, Any]:
+        out = await run_cmd(self._docker_ps, timeout=STATUS_TIMEOUT_SECONDS, binary=True)
+        out["stdout"] = out["stdout"].decode("utf-8", errors="replace")
+        return out
 
-        if op == "service_action":
-            if action not in self._allowed_actions("service"):
-                return {
-                    "ok": False,
-                    "return_code": -1,
-                    "stdout": "",
-                    "stderr": f"Action '{action}' is not allowed for service.",
-                }
-            if target not in self._configured_services():
-                return {
-                    "ok": False,
-                    "return_code": -1,
+    async def write_container_status_raw(self, conn: socket.socket, timeout: int = STATUS_TIMEOUT_SECONDS) -> None:
+        loop = asyncio.get_running_loop()
+        read_fd, write_fd = os.pipe()
+        try:
+            try:
+                # Larger pipe means fewer, bigger frames; the stream still drains if this fails.
+                fcntl.fcntl(write_fd, fcntl.F_SETPIPE_SZ, RAW_PIPE_BYTES)
+            except (AttributeError, OSError):
+                pass
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *self._docker_ps,
+                    stdout=write_fd,
+                    stderr=asyncio.subprocess.PIPE,
+                    close_fds=False,
+                )
+            except Exception as ex:  # noqa: BLE001
+                await loop.sock_sendall(conn, _encode_response(_error(str(ex))))
+                return
+            finally:
+                os.close(write_fd)
+            os.set_blocking(read_fd, False)
+            stderr_task = loop.create_task(read_capped(proc.stderr))
+            deadline = loop.time() + timeout
+            await loop.sock_sendall(conn, _RAW_TSV_HEADER)
+            try:
+                await stream_pipe_frames(read_fd, conn, deadline)
+                stderr, returncode = await asyncio.wait_for(
+                    asyncio.gather(stderr_task, proc.wait()),
+                    timeout=max(0.0, deadline - loop.time()),
+                )
+                trailer = {
+                    "ok": returncode == 0,
+                    "return_code": returncode,
                     "stdout": "",
-                    "stderr": f"Service '{target}' is not in allowlist.",
+                    "stderr": stderr.decode("utf-8", errors="replace").strip(),
                 }
-            return run_cmd(["systemctl", action, target], timeout=45)
-
-        if action not in self._allowed_actions("container"):
-            return {
-                "ok": False,
-                "return_code": -1,
-                "stdout": "",
-                "stderr": f"Action '{action}' is not allowed for container.",
-            }
-        if target not in self._configured_containers():
-            return {
-                "ok": False,
-                "return_code": -1,
-                "stdout": "",
-                "stderr": f"Container '{target}' is not in allowlist.",
-            }
-        return run_cmd(["docker", action, target], timeout=45)
+            except asyncio.TimeoutError:
+                stderr_task.cancel()
+                proc.kill()
+                await proc.wait()
+                trailer = _error(f"Command timed out after {timeout}s")
+            await loop.sock_sendall(conn, FRAME_HEADER.pack(0) + _encode_response(trailer))
+        finally:
+            os.close(read_fd)
+
+    async def _handle_status_map(self, action: str, target: str) -> dict[str, Any]:
+        return await self._container_status_map()
+
+    async def _handle_status_tsv(self, action: str, target: str) -> dict[str, Any]:
+        return await self._container_status_tsv()
+
+    async def _handle_service(self, action: str, target: str) -> dict[str, Any] | bytes:
+        if not target:
+            return _ERR_TARGET_REQUIRED
+        if action not in self._service_actions:
+            return _error(f"Action '{action}' is not allowed for service.")
+        if target not in self._services:
+            return _error(f"Service '{target}' is not in allowlist.")
+        if self._systemd_bus is not None and action in SYSTEMD_BUS_METHODS:
+            return await asyncio.to_thread(self._systemd_bus.run_action, action, target, ACTION_TIMEOUT_SECONDS)
+        return await run_cmd((self._systemctl, action, target), timeout=ACTION_TIMEOUT_SECONDS)
+
+    async def _handle_container(self, action: str, target: str) -> dict[str, Any] | bytes:
+        if not target:
+            return _ERR_TARGET_REQUIRED
+        if action not in self._container_actions:
+            return _error(f"Action '{action}' is not allowed for container.")
+        if target not in self._containers:
+            return _error(f"Container '{target}' is not in allowlist.")
+        self._invalidate_status()
+        try:
+            return await run_cmd((self._docker, action, target), timeout=ACTION_TIMEOUT_SECONDS)
+        finally:
+            # Status fetched while the action ran may show it half applied.
+            self._invalidate_status()
 
+    async def execute(self, req: dict[str, Any]) -> dict[str, Any] | bytes:
+        handler = _DISPATCH.get(_field(req, "op"))
+        if handler is None:
+            return _ERR_UNSUPPORTED
+        return await handler(self, _field(req, "action"), _field(req, "target"))
 
-class ThreadedUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
-    daemon_threads = True
 
+_DISPATCH = {
+    _OP_STATUS_MAP: PrivilegedApi._handle_status_map,
+    _OP_STATUS_TSV: PrivilegedApi._handle_status_tsv,
+    _OP_SERVICE: PrivilegedApi._handle_service,
+    _OP_CONTAINER: PrivilegedApi._handle_container,
+}
 
-class Handler(socketserver.StreamRequestHandler):
-    def _send(self, payload: dict[str, Any]) -> None:
-        blob = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
-        self.wfile.write(blob)
 
-    def handle(self) -> None:
-        max_body = max(1024, env_int("RC_HELPER_MAX_BODY_BYTES", DEFAULT_MAX_BODY_BYTES))
-        raw = self.rfile.readline(max_body + 2)
-        if not raw:
-            return
-        if len(raw) > (max_body + 1):
-            self._send({"ok": False, "return_code": -1, "stdout": "", "stderr": "Request body too large."})
-            return
-        if raw.endswith(b"\n"):
-            raw = raw[:-1]
-        try:
-            payload = json.loads(raw.decode("utf-8"))
-        except Exception:
-            self._send({"ok": False, "return_code": -1, "stdout": "", "stderr": "Invalid JSON payload."})
-            return
-        if not isinstance(payload, dict):
-            self._send({"ok": False, "return_code": -1, "stdout": "", "stderr": "Payload must be an object."})
+def _decode_request(raw: bytes | bytearray) -> dict[str, Any] | bytes:
+    try:
+        payload = load_json_bytes(raw)
+    except Exception:
+        return _ERR_INVALID_JSON
+    if not isinstance(payload, dict):
+        return _ERR_NOT_OBJECT
+    return payload
+
+
+async def _recv_request(conn: socket.socket, max_body: int) -> dict[str, Any] | bytes | None:
+    loop = asyncio.get_running_loop()
+    buf = bytearray()
+    scanned = 0
+    while True:
+        chunk = await loop.sock_recv(conn, RECV_BYTES)
+        if not chunk and not buf:
+            return None
+        buf += chunk
+        if buf[0] == 0:
+            if len(buf) >= FRAME_HEADER.size:
+                (length,) = FRAME_HEADER.unpack_from(buf)
+                if length > max_body:
+                    return _ERR_TOO_LARGE
+                end = FRAME_HEADER.size + length
+                if len(buf) >= end:
+                    return _decode_request(buf[FRAME_HEADER.size : end])
+        else:
+            newline = buf.find(b"\n", scanned)
+            if newline > max_body or (newline < 0 and len(buf) > max_body):
+                return _ERR_TOO_LARGE
+            if newline >= 0:
+                return _decode_request(buf[:newline])
+            if not chunk:
+                return _decode_request(buf)
+            scanned = len(buf)
+        if not chunk:
+            return _ERR_INVALID_JSON
+
+
+async def handle(conn: socket.socket, max_body: int) -> None:
+    loop = asyncio.get_running_loop()
+    try:
+        request = await _recv_request(conn, max_body)
+        if request is None:
             return
-        self._send(API.execute(payload))
+        if isinstance(request, bytes):
+            await loop.sock_sendall(conn, request)
+        elif _field(request, "op") == _OP_STATUS_RAW:
+            await API.write_container_status_raw(conn)
+        else:
+            await loop.sock_sendall(conn, _encode_response(await API.execute(request)))
+    except OSError:
+        pass
+    finally:
+        conn.close()
 
 
 def apply_socket_permissions(socket_path: Path) -> None:
@@ -217,6 +731,64 @@ def apply_socket_permissions(socket_path: Path) -> None:
         pass
 
 
+def install_child_watcher() -> None:
+    # Python 3.12+ already waits on children via pidfd; older versions default to a thread per child.
+    if sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(asyncio.get_running_loop())
+    asyncio.set_child_watcher(watcher)
+
+
+def bind_listener(socket_path: Path) -> socket.socket:
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(socket.SOMAXCONN)
+    listener.setblocking(False)
+    return listener
+
+
+def max_request_body() -> int:
+    return min(MAX_FRAME_BODY_BYTES, max(1024, env_int("RC_HELPER_MAX_BODY_BYTES", DEFAULT_MAX_BODY_BYTES)))
+
+
+async def serve(listener: socket.socket) -> None:
+    install_child_watcher()
+    max_body = max_request_body()
+    loop = asyncio.get_running_loop()
+    tasks: set[asyncio.Task[None]] = set()
+    while True:
+        conn, _ = await loop.sock_accept(listener)
+        conn.setblocking(False)
+        task = loop.create_task(handle(conn, max_body))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+
+def fork_workers(listener: socket.socket, count: int) -> list[int]:
+    children: list[int] = []
+    for _ in range(count):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            code = 0
+            try:
+                asyncio.run(serve(listener))
+            except KeyboardInterrupt:
+                pass
+            except BaseException:  # noqa: BLE001
+                traceback.print_exc()
+                code = 1
+            finally:
+                os._exit(code)
+        children.append(pid)
+    return children
+
+
 def main() -> None:
     socket_path = Path(os.environ.get("RC_HELPER_SOCKET", str(DEFAULT_SOCKET_PATH))).resolve()
     socket_path.parent.mkdir(parents=True, exist_ok=True)
@@ -226,13 +798,26 @@ def main() -> None:
         else:
             raise RuntimeError(f"Socket path exists and is not a socket: {socket_path}")
 
-    srv = ThreadedUnixServer(str(socket_path), Handler)
+    listener = bind_listener(socket_path)
     apply_socket_permissions(socket_path)
-    print(f"[rc-helper] listening on unix://{socket_path} config={API.config_path}", flush=True)
+    workers = max(1, env_int("RC_HELPER_WORKERS", os.cpu_count() or 1))
+    children = fork_workers(listener, workers - 1)
+    print(f"[rc-helper] listening on unix://{socket_path} config={API.config_path} workers={workers}", flush=True)
+
+    def terminate(_signum: int, _frame: Any) -> None:
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, terminate)
     try:
-        srv.serve_forever()
+        asyncio.run(serve(listener))
     finally:
-        srv.server_close()
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        listener.close()
         try:
             if socket_path.exists() and socket_path.is_socket():
                 socket_path.unlink()
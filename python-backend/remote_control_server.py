@@ -1,20 +1,37 @@
 #!/usr/bin/env python3
 import datetime as dt
+import errno
+import heapq
 import hmac
+import http.client
 import json
 import os
+import queue
+import select
+import selectors
 import shutil
 import socket
 import sqlite3
+import ssl
+import struct
 import subprocess
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Generator, Iterator
 from urllib import error as url_error
 from urllib import request as url_request
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qsl, urljoin, urlparse
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -25,6 +42,140 @@ DEFAULT_DB_PATH = BASE_DIR / "data" / "health.sqlite3"
 DEFAULT_HELPER_SOCKET = "/run/rc-control/helper.sock"
 DEFAULT_HELPER_TIMEOUT_SECONDS = 15
 MAX_AUDIT_LIMIT = 500
+MAX_CMD_OUTPUT_BYTES = 1024 * 1024
+MAX_QUERY_FIELDS = 16
+DEFAULT_WAL_CHECKPOINT_BYTES = 16 * 1024 * 1024
+DEFAULT_DB_READERS = 8
+DEFAULT_DB_CACHE_KIB = 20000
+DEFAULT_DB_MMAP_BYTES = 256 * 1024 * 1024
+SCHEMA_VERSION = 3
+DEFAULT_PROBE_RUNS_KEEP = 5000
+DEFAULT_AUDIT_KEEP = 100000
+AUDIT_QUEUE_MAX = 4096
+AUDIT_BATCH_MAX = 100
+HTTP_PROBE_HEADERS = {"User-Agent": "DireRemoteControl/0.2", "Accept": "*/*"}
+HTTP_RETRY_STATUSES = frozenset({502, 503, 504})
+HTTP_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+HTTP_MAX_REDIRECTS = 5
+HTTP_DRAIN_BYTES = 65536
+HTTP_IDLE_MAX_SECONDS = 30.0
+MEM_CACHE_TTL_NS = 500_000_000
+PROBE_STEP_WORKERS = 4
+DEFAULT_PROBE_WORKERS = 4
+STATUS_PART_WORKERS = 8
+DNS_CACHE_TTL_NS = 60_000_000_000
+DNS_CACHE_MAX_ENTRIES = 256
+DEFAULT_HTTP_WORKERS = 32
+DEFAULT_HTTP_KEEPALIVE_SECONDS = 15.0
+DEFAULT_STATUS_CACHE_TTL_SECONDS = 3.0
+HELPER_FRAME_HEADER = struct.Struct("!I")
+# The helper tells framed requests from newline JSON by a leading NUL length byte.
+HELPER_MAX_FRAME_BODY_BYTES = (1 << 24) - 1
+HOST_NAME = socket.gethostname()
+HEALTH_TEMPLATE = b'{"ok":true,"timestamp_utc":"%b"}'
+AUDIT_TEMPLATE = b'{"ok":true,"rows":%b}'
+PROBE_HISTORY_TEMPLATE = b'{"ok":true,"probe_key":%b,"rows":%b}'
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_HAS_LOADAVG = hasattr(os, "getloadavg")
+
+_SQL_UPSERT_DEFINITION = """
+INSERT INTO probe_definitions (
+    probe_key, probe_type, interval_seconds, timeout_seconds,
+    stale_after_seconds, enabled, probe_config_json, next_run_us, last_run_us
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL)
+ON CONFLICT(probe_key) DO UPDATE SET
+    probe_type = excluded.probe_type,
+    interval_seconds = excluded.interval_seconds,
+    timeout_seconds = excluded.timeout_seconds,
+    stale_after_seconds = excluded.stale_after_seconds,
+    enabled = excluded.enabled,
+    probe_config_json = excluded.probe_config_json
+"""
+_SQL_DISABLE_MISSING = "UPDATE probe_definitions SET enabled = 0 WHERE probe_key NOT IN (SELECT value FROM json_each(?))"
+_SQL_LIST_ENABLED = """
+SELECT * FROM probe_definitions
+WHERE enabled = 1
+ORDER BY COALESCE(next_run_us, 0) ASC, probe_key ASC
+"""
+_SQL_UPDATE_NEXT = "UPDATE probe_definitions SET next_run_us = ? WHERE probe_key = ?"
+_SQL_INSERT_RUN = """
+INSERT INTO probe_runs (
+    probe_key, started_at, ended_at, ok, status, latency_ms, error, payload_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_RUN_TIMES = """
+UPDATE probe_definitions
+SET last_run_us = ?, next_run_us = ?
+WHERE probe_key = ?
+"""
+_SQL_PRUNE_RUNS = """
+DELETE FROM probe_runs
+WHERE probe_key = ? AND id <= (
+    SELECT id FROM probe_runs WHERE probe_key = ? ORDER BY id DESC LIMIT 1 OFFSET ?
+)
+"""
+_SQL_PRUNE_AUDIT = """
+DELETE FROM action_audit
+WHERE id <= (SELECT id FROM action_audit ORDER BY id DESC LIMIT 1 OFFSET ?)
+"""
+_SQL_PROBE_HISTORY_JSON = """
+SELECT json_group_array(json_object(
+    'id', id,
+    'probe_key', probe_key,
+    'started_at', started_at,
+    'ended_at', ended_at,
+    'ok', json(CASE WHEN ok THEN 'true' ELSE 'false' END),
+    'status', status,
+    'latency_ms', latency_ms,
+    'error', error,
+    'payload', CASE
+        WHEN NOT ? THEN NULL
+        WHEN json_valid(payload_json) THEN
+            CASE WHEN json_type(payload_json) = 'object' THEN json(payload_json) ELSE json('{}') END
+        ELSE json('{}')
+    END
+))
+FROM (
+    SELECT * FROM probe_runs
+    WHERE probe_key = ?
+    ORDER BY id DESC
+    LIMIT ?
+)
+"""
+_SQL_AUDIT_OBJECT = """json_object(
+    'timestamp_utc', timestamp_utc,
+    'actor', actor,
+    'remote_ip', remote_ip,
+    'target_type', target_type,
+    'target', target,
+    'action', action,
+    'reason', reason,
+    'ok', json(CASE WHEN ok THEN 'true' ELSE 'false' END),
+    'return_code', return_code,
+    'stderr', stderr
+)"""
+_SQL_AUDIT_JSON = f"""
+SELECT json_group_array({_SQL_AUDIT_OBJECT})
+FROM (
+    SELECT * FROM action_audit
+    ORDER BY id DESC
+    LIMIT ?
+)
+"""
+_SQL_AUDIT_ROWS_JSON = f"""
+SELECT {_SQL_AUDIT_OBJECT}
+FROM action_audit
+ORDER BY id DESC
+LIMIT ?
+"""
+_SQL_INSERT_AUDIT = """
+INSERT INTO action_audit (
+    timestamp_utc, actor, remote_ip, target_type, target, action, reason, ok, return_code, stderr
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
 
 
 def now_utc() -> str:
@@ -40,6 +191,25 @@ def parse_iso(value: str | None) -> dt.datetime | None:
         return None
 
 
+def now_epoch_us() -> int:
+    return time.time_ns() // 1000
+
+
+def epoch_us_to_iso(value: int | None) -> str | None:
+    if value is None:
+        return None
+    return (_EPOCH + dt.timedelta(microseconds=value)).isoformat()
+
+
+def iso_to_epoch_us(value: str | None) -> int | None:
+    parsed = parse_iso(value)
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+    return (parsed - _EPOCH) // dt.timedelta(microseconds=1)
+
+
 def env_int(name: str, default_value: int) -> int:
     raw = os.environ.get(name, "").strip()
     if not raw:
@@ -60,10 +230,23 @@ def env_float(name: str, default_value: float) -> float:
         return default_value
 
 
+def dump_json_bytes(payload: Any) -> bytes:
+    if _HAS_ORJSON:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return _JSON_ENCODER.encode(payload).encode("utf-8")
+
+
+def load_json_bytes(blob: bytes | str) -> Any:
+    if _HAS_ORJSON:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
 def read_json_file(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-    data = json.loads(path.read_text(encoding="utf-8"))
+    try:
+        data = load_json_bytes(path.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
     if not isinstance(data, dict):
         raise ValueError("Config file must contain a JSON object.")
     return data
@@ -71,28 +254,7 @@ def read_json_file(path: Path) -> dict[str, Any]:
 
 def run_cmd(command: list[str], timeout: int = 20) -> dict[str, Any]:
     try:
-        proc = subprocess.run(
-            command,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
-        )
-        return {
-            "ok": proc.returncode == 0,
-            "return_code": proc.returncode,
-            "stdout": (proc.stdout or "").strip(),
-            "stderr": (proc.stderr or "").strip(),
-            "command": command,
-        }
-    except subprocess.TimeoutExpired:
-        return {
-            "ok": False,
-            "return_code": -1,
-            "stdout": "",
-            "stderr": f"Command timed out after {timeout}s",
-            "command": command,
-        }
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     except Exception as ex:
         return {
             "ok": False,
@@ -102,16 +264,77 @@ def run_cmd(command: list[str], timeout: int = 20) -> dict[str, Any]:
             "command": command,
         }
 
+    # stderr keeps draining past the cap so a chatty child never blocks on a full pipe;
+    # stdout past the cap would be parsed as if complete, so that fails the command instead.
+    captured = {proc.stdout: bytearray(), proc.stderr: bytearray()}
+    deadline = time.monotonic() + timeout
+    timed_out = False
+    truncated = False
+    with proc, selectors.DefaultSelector() as sel:
+        for stream in captured:
+            sel.register(stream, selectors.EVENT_READ)
+        while sel.get_map() and not truncated:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                break
+            for key, _ in sel.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    continue
+                buf = captured[key.fileobj]
+                if key.fileobj is proc.stdout and len(buf) + len(chunk) > MAX_CMD_OUTPUT_BYTES:
+                    truncated = True
+                    break
+                if len(buf) < MAX_CMD_OUTPUT_BYTES:
+                    buf += chunk[: MAX_CMD_OUTPUT_BYTES - len(buf)]
+        if truncated:
+            proc.kill()
+            proc.wait()
+            return {
+                "ok": False,
+                "return_code": -1,
+                "stdout": "",
+                "stderr": f"Command output exceeded {MAX_CMD_OUTPUT_BYTES} bytes and was cut off",
+                "truncated": True,
+                "command": command,
+            }
+        if not timed_out:
+            try:
+                proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                timed_out = True
+        if timed_out:
+            proc.kill()
+            proc.wait()
+            return {
+                "ok": False,
+                "return_code": -1,
+                "stdout": "",
+                "stderr": f"Command timed out after {timeout}s",
+                "command": command,
+            }
+    return {
+        "ok": proc.returncode == 0,
+        "return_code": proc.returncode,
+        "stdout": captured[proc.stdout].decode("utf-8", errors="replace").strip(),
+        "stderr": captured[proc.stderr].decode("utf-8", errors="replace").strip(),
+        "command": command,
+    }
+
 
 class PrivilegedHelperClient:
     def __init__(self):
         self.socket_path = Path(os.environ.get("RC_HELPER_SOCKET", DEFAULT_HELPER_SOCKET)).resolve()
         self.timeout_seconds = max(1, env_int("RC_HELPER_TIMEOUT_SECONDS", DEFAULT_HELPER_TIMEOUT_SECONDS))
-        self.max_body_bytes = max(1024, env_int("RC_HELPER_MAX_BODY_BYTES", 16384))
+        self.max_body_bytes = min(
+            HELPER_MAX_FRAME_BODY_BYTES, max(1024, env_int("RC_HELPER_MAX_BODY_BYTES", 16384))
+        )
 
     def _request(self, payload: dict[str, Any]) -> dict[str, Any]:
         try:
-            raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            raw = dump_json_bytes(payload)
         except Exception as ex:  # noqa: BLE001
             return {
                 "ok": False,
@@ -132,7 +355,7 @@ class PrivilegedHelperClient:
             with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
                 sock.settimeout(float(self.timeout_seconds))
                 sock.connect(str(self.socket_path))
-                sock.sendall(raw + b"\n")
+                sock.sendall(HELPER_FRAME_HEADER.pack(len(raw)) + raw)
                 sock.shutdown(socket.SHUT_WR)
                 chunks: list[bytes] = []
                 while True:
@@ -172,7 +395,7 @@ class PrivilegedHelperClient:
 
         blob = b"".join(chunks).strip()
         try:
-            response = json.loads(blob.decode("utf-8"))
+            response = load_json_bytes(blob)
         except Exception:
             text = blob.decode("utf-8", errors="replace")
             return {
@@ -223,53 +446,136 @@ class PrivilegedHelperClient:
         }
 
 
+_mem_cache: tuple[int, dict[str, Any]] = (0, {})
+_proc_fds: dict[str, int] = {}
+
+
+def read_proc_file(path: str) -> bytes | None:
+    fd = _proc_fds.get(path)
+    if fd is None:
+        try:
+            new_fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
+            return None
+        fd = _proc_fds.setdefault(path, new_fd)
+        if fd != new_fd:
+            os.close(new_fd)
+    try:
+        return os.pread(fd, 4096, 0)
+    except OSError:
+        return None
+
+
+def _meminfo_kb(buf: bytes, key: bytes) -> int | None:
+    idx = buf.find(key)
+    if idx < 0:
+        return None
+    start = idx + len(key)
+    end = buf.find(b"\n", start)
+    try:
+        return int(buf[start : end if end >= 0 else len(buf)].split(None, 1)[0])
+    except (IndexError, ValueError):
+        return None
+
+
 def mem_snapshot() -> dict[str, Any]:
-    meminfo = Path("/proc/meminfo")
-    if not meminfo.exists():
+    global _mem_cache
+    deadline_ns, snapshot = _mem_cache
+    now_ns = time.monotonic_ns()
+    if now_ns < deadline_ns:
+        return snapshot
+
+    buf = read_proc_file("/proc/meminfo")
+    if buf is None:
         return {"available": False}
-    values: dict[str, int] = {}
-    for line in meminfo.read_text(encoding="utf-8").splitlines():
-        if ":" not in line:
-            continue
-        key, value = line.split(":", 1)
-        amount = value.strip().split(" ", 1)[0]
-        try:
-            values[key] = int(amount)
-        except ValueError:
-            continue
-    total = values.get("MemTotal", 0)
-    free = values.get("MemAvailable", values.get("MemFree", 0))
+
+    total = _meminfo_kb(buf, b"MemTotal:") or 0
+    free = _meminfo_kb(buf, b"MemAvailable:")
+    if free is None:
+        free = _meminfo_kb(buf, b"MemFree:") or 0
     used = max(total - free, 0)
     used_pct = (used / total * 100.0) if total else 0.0
-    return {
+    snapshot = {
         "available": True,
         "total_kb": total,
         "free_kb": free,
         "used_kb": used,
         "used_pct": round(used_pct, 2),
     }
+    _mem_cache = (now_ns + MEM_CACHE_TTL_NS, snapshot)
+    return snapshot
 
 
 def uptime_seconds() -> int | None:
-    p = Path("/proc/uptime")
-    if not p.exists():
+    buf = read_proc_file("/proc/uptime")
+    if buf is None:
         return None
     try:
-        return int(float(p.read_text(encoding="utf-8").split()[0]))
-    except Exception:
+        return int(float(buf.split(None, 1)[0]))
+    except (IndexError, ValueError):
         return None
 
 
+_SOCK_NONBLOCK = getattr(socket, "SOCK_NONBLOCK", 0)
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+_dns_cache: dict[tuple[str, int], tuple[int, list[tuple[Any, ...]]]] = {}
+
+
+def resolve_stream_addrs(host: str, port: int) -> list[tuple[Any, ...]]:
+    key = (host, port)
+    now_ns = time.monotonic_ns()
+    cached = _dns_cache.get(key)
+    if cached is not None and now_ns < cached[0]:
+        return cached[1]
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    if len(_dns_cache) >= DNS_CACHE_MAX_ENTRIES:
+        _dns_cache.clear()
+    _dns_cache[key] = (now_ns + DNS_CACHE_TTL_NS, infos)
+    return infos
+
+
+def _connect_nonblocking(addrinfo: tuple[Any, ...], timeout: float) -> None:
+    family, socktype, proto, _, addr = addrinfo
+    with socket.socket(family, socktype | _SOCK_NONBLOCK, proto) as sock, selectors.DefaultSelector() as sel:
+        if not _SOCK_NONBLOCK:
+            sock.setblocking(False)
+        if family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if _TCP_QUICKACK is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+        rc = sock.connect_ex(addr)
+        if rc in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+            sel.register(sock, selectors.EVENT_WRITE)
+            if not sel.select(timeout):
+                raise TimeoutError("timed out")
+            rc = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if rc:
+            raise OSError(rc, os.strerror(rc))
+
+
 def tcp_check(host: str, port: int, timeout: float = 1.5) -> dict[str, Any]:
-    started = dt.datetime.now(dt.timezone.utc)
+    started_ns = time.monotonic_ns()
+    deadline = time.monotonic() + timeout
     ok = False
     error = ""
     try:
-        with socket.create_connection((host, port), timeout=timeout):
-            ok = True
+        last_error: Exception | None = None
+        for addrinfo in resolve_stream_addrs(host, port):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                last_error = TimeoutError("timed out")
+                break
+            try:
+                _connect_nonblocking(addrinfo, remaining)
+                ok = True
+                break
+            except OSError as ex:
+                last_error = ex
+        if not ok:
+            error = str(last_error) if last_error else f"No addresses for {host}"
     except Exception as ex:
         error = str(ex)
-    elapsed_ms = (dt.datetime.now(dt.timezone.utc) - started).total_seconds() * 1000.0
+    elapsed_ms = (time.monotonic_ns() - started_ns) / 1e6
     return {
         "host": host,
         "port": port,
@@ -279,6 +585,124 @@ def tcp_check(host: str, port: int, timeout: float = 1.5) -> dict[str, Any]:
     }
 
 
+PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=PROBE_STEP_WORKERS, thread_name_prefix="rc-probe-step")
+STATUS_EXECUTOR = ThreadPoolExecutor(max_workers=STATUS_PART_WORKERS, thread_name_prefix="rc-status")
+# du-based disk reports are slow; keep them off STATUS_EXECUTOR so they never starve status lookups.
+DISK_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rc-disk")
+
+
+class HttpProber:
+    def __init__(self, max_idle_per_host: int = 8, retries: int = 2, backoff_seconds: float = 0.1):
+        self.max_idle_per_host = max_idle_per_host
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str, int], list[tuple[float, http.client.HTTPConnection]]] = {}
+        self._ssl_context = ssl.create_default_context()
+        # The pooled http.client path connects directly, so proxied targets go through urllib.
+        self._proxies = url_request.getproxies()
+
+    def _uses_proxy(self, scheme: str, host: str) -> bool:
+        return scheme in self._proxies and not url_request.proxy_bypass(host)
+
+    @staticmethod
+    def _fetch_via_proxy(url: str, method: str, timeout: float) -> tuple[int, bytes]:
+        req = url_request.Request(url=url, method=method, headers=HTTP_PROBE_HEADERS)
+        try:
+            with url_request.urlopen(req, timeout=timeout) as resp:
+                return int(resp.status), resp.read(512)
+        except url_error.HTTPError as ex:
+            with ex:
+                return int(ex.code), ex.read(512)
+
+    @staticmethod
+    def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+        # An idle keep-alive socket should have nothing to read; EOF or stray bytes mean the peer gave up on it.
+        if conn.sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _checkout(self, pool_key: tuple[str, str, int], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        expire_before = time.monotonic() - HTTP_IDLE_MAX_SECONDS
+        while True:
+            with self._lock:
+                idle = self._idle.get(pool_key)
+                idle_since, conn = idle.pop() if idle else (0.0, None)
+            if conn is None:
+                scheme, host, port = pool_key
+                if scheme == "https":
+                    return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context), False
+                return http.client.HTTPConnection(host, port, timeout=timeout), False
+            if idle_since < expire_before or self._is_dropped(conn):
+                conn.close()
+                continue
+            conn.timeout = timeout
+            conn.sock.settimeout(timeout)
+            return conn, True
+
+    def _checkin(self, pool_key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(pool_key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((time.monotonic(), conn))
+                return
+        conn.close()
+
+    def _send(self, pool_key: tuple[str, str, int], method: str, path: str, timeout: float) -> tuple[int, bytes, str]:
+        conn, reused = self._checkout(pool_key, timeout)
+        try:
+            conn.request(method, path, headers=HTTP_PROBE_HEADERS)
+            resp = conn.getresponse()
+            body = resp.read(512)
+            if not resp.isclosed():
+                resp.read(HTTP_DRAIN_BYTES)
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+            conn.close()
+            if reused:
+                return self._send(pool_key, method, path, timeout)
+            raise
+        except BaseException:
+            conn.close()
+            raise
+
+        if resp.isclosed() and not resp.will_close:
+            self._checkin(pool_key, conn)
+        else:
+            conn.close()
+        return int(resp.status), body, resp.getheader("Location", "")
+
+    def fetch(self, url: str, method: str, timeout: float) -> tuple[int, bytes]:
+        attempt = 0
+        redirects = 0
+        while True:
+            p = urlparse(url)
+            if p.scheme not in ("http", "https") or not p.hostname:
+                raise ValueError(f"Unsupported probe URL: {url}")
+            if self._uses_proxy(p.scheme, p.hostname):
+                return self._fetch_via_proxy(url, method, timeout)
+            path = (p.path or "/") + (f"?{p.query}" if p.query else "")
+            pool_key = (p.scheme, p.hostname, p.port or (443 if p.scheme == "https" else 80))
+            status, body, location = self._send(pool_key, method, path, timeout)
+            if status in HTTP_RETRY_STATUSES and attempt < self.retries:
+                time.sleep(self.backoff_seconds * (2**attempt))
+                attempt += 1
+                continue
+            if status in HTTP_REDIRECT_STATUSES and location and redirects < HTTP_MAX_REDIRECTS:
+                url = urljoin(url, location)
+                if status == 303 and method != "HEAD":
+                    method = "GET"
+                redirects += 1
+                continue
+            return status, body
+
+
+HTTP_PROBER = HttpProber()
+
+
 def http_probe(
     url: str,
     timeout_seconds: float = 3.0,
@@ -286,19 +710,14 @@ def http_probe(
     expected_status: list[int] | None = None,
     allow_4xx: bool = True,
 ) -> dict[str, Any]:
-    started = dt.datetime.now(dt.timezone.utc)
+    started_ns = time.monotonic_ns()
     status = 0
     body = ""
     error_message = ""
     ok = False
     try:
-        req = url_request.Request(url=url, method=method.upper())
-        with url_request.urlopen(req, timeout=timeout_seconds) as resp:
-            status = int(resp.status)
-            body = resp.read(512).decode("utf-8", errors="replace")
-    except url_error.HTTPError as ex:
-        status = int(ex.code)
-        body = ex.read(512).decode("utf-8", errors="replace")
+        status, raw = HTTP_PROBER.fetch(url, method.upper(), timeout_seconds)
+        body = raw.decode("utf-8", errors="replace")
     except Exception as ex:  # noqa: BLE001
         error_message = str(ex)
 
@@ -310,7 +729,7 @@ def http_probe(
         else:
             ok = 200 <= status < 400
 
-    elapsed_ms = (dt.datetime.now(dt.timezone.utc) - started).total_seconds() * 1000.0
+    elapsed_ms = (time.monotonic_ns() - started_ns) / 1e6
     return {
         "url": url,
         "method": method.upper(),
@@ -342,65 +761,215 @@ def parse_percent(value: str) -> float | None:
         return None
 
 
+class TTLCache:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_ns = int(ttl_seconds * 1_000_000_000)
+        self._lock = threading.Lock()
+        self._entries: dict[Any, tuple[int, Any]] = {}
+        self._inflight: dict[Any, threading.Event] = {}
+        # Bumped by invalidate(); a compute that started before it must not store its value.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Any, compute: Callable[[], Any]) -> Any:
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and time.monotonic_ns() < entry[0]:
+                    self.hits += 1
+                    return entry[1]
+                event = self._inflight.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._inflight[key] = event
+                    generation = self._generation
+                    self.misses += 1
+                    break
+            event.wait()
+
+        try:
+            value = compute()
+            with self._lock:
+                if generation == self._generation:
+                    self._entries[key] = (time.monotonic_ns() + self.ttl_ns, value)
+            return value
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is event:
+                    del self._inflight[key]
+            event.set()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._inflight.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
 class SQLiteStore:
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
-        self.conn.execute("PRAGMA journal_mode=WAL;")
-        self.conn.execute("PRAGMA synchronous=NORMAL;")
+        self._cache_kib = max(2000, env_int("RC_DB_CACHE_KIB", DEFAULT_DB_CACHE_KIB))
+        self._mmap_bytes = max(0, env_int("RC_DB_MMAP_BYTES", DEFAULT_DB_MMAP_BYTES))
+        self._write_conn = self._connect()
+        self._write_conn.execute("PRAGMA journal_mode=WAL;")
+        self._write_conn.execute("PRAGMA synchronous=NORMAL;")
+        self._write_conn.execute("PRAGMA wal_autocheckpoint=1000;")
+        self.wal_path = self.db_path.with_name(self.db_path.name + "-wal")
         self._init_schema()
 
+        self._reader_pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(max(1, env_int("RC_DB_READERS", DEFAULT_DB_READERS))):
+            conn = self._connect()
+            conn.execute("PRAGMA query_only=1;")
+            self._reader_pool.put(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=5000;")
+        conn.execute(f"PRAGMA cache_size=-{self._cache_kib};")
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute(f"PRAGMA mmap_size={self._mmap_bytes};")
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        conn = self._reader_pool.get()
+        try:
+            yield conn
+        finally:
+            self._reader_pool.put(conn)
+
     def _init_schema(self) -> None:
         with self._lock:
-            self.conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS probe_definitions (
-                    probe_key TEXT PRIMARY KEY,
-                    probe_type TEXT NOT NULL,
-                    interval_seconds INTEGER NOT NULL,
-                    timeout_seconds INTEGER NOT NULL,
-                    stale_after_seconds INTEGER NOT NULL,
-                    enabled INTEGER NOT NULL,
-                    probe_config_json TEXT NOT NULL,
-                    next_run_at TEXT,
-                    last_run_at TEXT
-                );
-
-                CREATE TABLE IF NOT EXISTS probe_runs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    probe_key TEXT NOT NULL,
-                    started_at TEXT NOT NULL,
-                    ended_at TEXT NOT NULL,
-                    ok INTEGER NOT NULL,
-                    status TEXT NOT NULL,
-                    latency_ms REAL NOT NULL,
-                    error TEXT,
-                    payload_json TEXT NOT NULL
-                );
-                CREATE INDEX IF NOT EXISTS idx_probe_runs_probe_key_id
-                    ON probe_runs(probe_key, id DESC);
-
-                CREATE TABLE IF NOT EXISTS action_audit (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp_utc TEXT NOT NULL,
-                    actor TEXT,
-                    remote_ip TEXT,
-                    target_type TEXT,
-                    target TEXT,
-                    action TEXT,
-                    reason TEXT,
-                    ok INTEGER NOT NULL,
-                    return_code INTEGER,
-                    stderr TEXT
-                );
-                CREATE INDEX IF NOT EXISTS idx_action_audit_time
-                    ON action_audit(timestamp_utc DESC);
-                """
-            )
-            self.conn.commit()
+            version = self._write_conn.execute("PRAGMA user_version;").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+            if version < 1:
+                self._write_conn.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS probe_definitions (
+                        probe_key TEXT PRIMARY KEY,
+                        probe_type TEXT NOT NULL,
+                        interval_seconds INTEGER NOT NULL,
+                        timeout_seconds INTEGER NOT NULL,
+                        stale_after_seconds INTEGER NOT NULL,
+                        enabled INTEGER NOT NULL,
+                        probe_config_json TEXT NOT NULL,
+                        next_run_at TEXT,
+                        last_run_at TEXT
+                    );
+
+                    CREATE TABLE IF NOT EXISTS probe_runs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        probe_key TEXT NOT NULL,
+                        started_at TEXT NOT NULL,
+                        ended_at TEXT NOT NULL,
+                        ok INTEGER NOT NULL,
+                        status TEXT NOT NULL,
+                        latency_ms REAL NOT NULL,
+                        error TEXT,
+                        payload_json TEXT NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_probe_runs_probe_key_id
+                        ON probe_runs(probe_key, id DESC);
+
+                    CREATE TABLE IF NOT EXISTS action_audit (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        timestamp_utc TEXT NOT NULL,
+                        actor TEXT,
+                        remote_ip TEXT,
+                        target_type TEXT,
+                        target TEXT,
+                        action TEXT,
+                        reason TEXT,
+                        ok INTEGER NOT NULL,
+                        return_code INTEGER,
+                        stderr TEXT
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_action_audit_time
+                        ON action_audit(timestamp_utc DESC);
+                    """
+                )
+            if version < 2:
+                if self._write_conn.execute("PRAGMA auto_vacuum;").fetchone()[0] != 2:
+                    self._write_conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
+                    self._write_conn.execute("VACUUM;")
+            if version < 3:
+                rows = self._write_conn.execute("SELECT * FROM probe_definitions").fetchall()
+                self._write_conn.execute("BEGIN")
+                self._write_conn.execute(
+                    """
+                    CREATE TABLE probe_definitions_v3 (
+                        probe_key TEXT PRIMARY KEY,
+                        probe_type TEXT NOT NULL,
+                        interval_seconds INTEGER NOT NULL,
+                        timeout_seconds INTEGER NOT NULL,
+                        stale_after_seconds INTEGER NOT NULL,
+                        enabled INTEGER NOT NULL,
+                        probe_config_json TEXT NOT NULL,
+                        next_run_us INTEGER,
+                        last_run_us INTEGER
+                    )
+                    """
+                )
+                self._write_conn.executemany(
+                    "INSERT INTO probe_definitions_v3 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            r["probe_key"],
+                            r["probe_type"],
+                            r["interval_seconds"],
+                            r["timeout_seconds"],
+                            r["stale_after_seconds"],
+                            r["enabled"],
+                            r["probe_config_json"],
+                            iso_to_epoch_us(r["next_run_at"]),
+                            iso_to_epoch_us(r["last_run_at"]),
+                        )
+                        for r in rows
+                    ],
+                )
+                self._write_conn.execute("DROP TABLE probe_definitions")
+                self._write_conn.execute("ALTER TABLE probe_definitions_v3 RENAME TO probe_definitions")
+                self._write_conn.execute(
+                    "CREATE INDEX idx_probe_definitions_due ON probe_definitions(enabled, next_run_us)"
+                )
+            self._write_conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
+            self._write_conn.commit()
+
+    def checkpoint_wal(self, threshold_bytes: int) -> bool:
+        try:
+            wal_size = self.wal_path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if wal_size < threshold_bytes:
+            return False
+        with self._lock:
+            self._write_conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        return True
+
+    def prune(self, keep_runs: int, keep_audit: int) -> int:
+        with self._reader() as conn:
+            keys = [r[0] for r in conn.execute("SELECT DISTINCT probe_key FROM probe_runs").fetchall()]
+        deleted = 0
+        with self._lock, self._write_conn:
+            self._write_conn.execute("BEGIN IMMEDIATE")
+            for key in keys:
+                deleted += self._write_conn.execute(_SQL_PRUNE_RUNS, (key, key, keep_runs)).rowcount
+            deleted += self._write_conn.execute(_SQL_PRUNE_AUDIT, (keep_audit,)).rowcount
+        if deleted:
+            with self._lock:
+                self._write_conn.executescript("PRAGMA incremental_vacuum(256);")
+        return deleted
 
     @staticmethod
     def _normalize_probe_definition(defn: dict[str, Any]) -> dict[str, Any]:
@@ -426,69 +995,42 @@ class SQLiteStore:
             "timeout_seconds": max(1, timeout_seconds),
             "stale_after_seconds": max(10, stale_after_seconds),
             "enabled": 1 if enabled else 0,
-            "probe_config_json": json.dumps(cfg, ensure_ascii=True),
+            "probe_config_json": dump_json_bytes(cfg).decode("utf-8"),
         }
 
     def sync_probe_definitions(self, definitions: list[dict[str, Any]]) -> None:
-        now = now_utc()
+        now = now_epoch_us()
         normed = [self._normalize_probe_definition(d) for d in definitions]
         desired_keys = {n["probe_key"] for n in normed}
 
-        with self._lock:
-            for n in normed:
-                row = self.conn.execute(
-                    "SELECT probe_key FROM probe_definitions WHERE probe_key = ?",
-                    (n["probe_key"],),
-                ).fetchone()
-                if row is None:
-                    self.conn.execute(
-                        """
-                        INSERT INTO probe_definitions (
-                            probe_key, probe_type, interval_seconds, timeout_seconds,
-                            stale_after_seconds, enabled, probe_config_json, next_run_at, last_run_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL)
-                        """,
-                        (
-                            n["probe_key"],
-                            n["probe_type"],
-                            n["interval_seconds"],
-                            n["timeout_seconds"],
-                            n["stale_after_seconds"],
-                            n["enabled"],
-                            n["probe_config_json"],
-                            now,
-                        ),
-                    )
-                else:
-                    self.conn.execute(
-                        """
-                        UPDATE probe_definitions
-                        SET probe_type = ?, interval_seconds = ?, timeout_seconds = ?,
-                            stale_after_seconds = ?, enabled = ?, probe_config_json = ?
-                        WHERE probe_key = ?
-                        """,
-                        (
-                            n["probe_type"],
-                            n["interval_seconds"],
-                            n["timeout_seconds"],
-                            n["stale_after_seconds"],
-                            n["enabled"],
-                            n["probe_config_json"],
-                            n["probe_key"],
-                        ),
+        with self._lock, self._write_conn:
+            self._write_conn.execute("BEGIN IMMEDIATE")
+            self._write_conn.executemany(
+                _SQL_UPSERT_DEFINITION,
+                [
+                    (
+                        n["probe_key"],
+                        n["probe_type"],
+                        n["interval_seconds"],
+                        n["timeout_seconds"],
+                        n["stale_after_seconds"],
+                        n["enabled"],
+                        n["probe_config_json"],
+                        now,
                     )
+                    for n in normed
+                ],
+            )
 
             if desired_keys:
-                placeholders = ",".join(["?"] * len(desired_keys))
-                self.conn.execute(
-                    f"UPDATE probe_definitions SET enabled = 0 WHERE probe_key NOT IN ({placeholders})",
-                    tuple(sorted(desired_keys)),
+                self._write_conn.execute(
+                    _SQL_DISABLE_MISSING,
+                    (dump_json_bytes(list(desired_keys)).decode("utf-8"),),
                 )
-            self.conn.commit()
 
     def get_probe_definition(self, key: str) -> dict[str, Any] | None:
-        with self._lock:
-            row = self.conn.execute(
+        with self._reader() as conn:
+            row = conn.execute(
                 "SELECT * FROM probe_definitions WHERE probe_key = ?",
                 (key,),
             ).fetchone()
@@ -496,25 +1038,18 @@ class SQLiteStore:
             return None
         return self._row_to_probe(row)
 
-    def list_due_probes(self, now_iso: str) -> list[dict[str, Any]]:
-        with self._lock:
-            rows = self.conn.execute(
-                """
-                SELECT * FROM probe_definitions
-                WHERE enabled = 1 AND (next_run_at IS NULL OR next_run_at <= ?)
-                ORDER BY COALESCE(next_run_at, '') ASC, probe_key ASC
-                """,
-                (now_iso,),
-            ).fetchall()
-        return [self._row_to_probe(r) for r in rows]
+    def list_probe_schedule(self) -> list[tuple[int, dict[str, Any]]]:
+        with self._reader() as conn:
+            rows = conn.execute(_SQL_LIST_ENABLED).fetchall()
+        return [(int(r["next_run_us"] or 0), self._row_to_probe(r)) for r in rows]
 
     def _row_to_probe(self, row: sqlite3.Row) -> dict[str, Any]:
         cfg: dict[str, Any] = {}
         try:
-            parsed = json.loads(row["probe_config_json"] or "{}")
+            parsed = load_json_bytes(row["probe_config_json"] or "{}")
             if isinstance(parsed, dict):
                 cfg = parsed
-        except json.JSONDecodeError:
+        except ValueError:
             cfg = {}
         return {
             "key": row["probe_key"],
@@ -523,52 +1058,56 @@ class SQLiteStore:
             "timeout_seconds": int(row["timeout_seconds"]),
             "stale_after_seconds": int(row["stale_after_seconds"]),
             "enabled": bool(int(row["enabled"])),
-            "next_run_at": row["next_run_at"],
-            "last_run_at": row["last_run_at"],
+            "next_run_at": epoch_us_to_iso(row["next_run_us"]),
+            "last_run_at": epoch_us_to_iso(row["last_run_us"]),
             "config": cfg,
         }
 
-    def set_probe_next_run(self, key: str, next_run_at: str) -> None:
-        with self._lock:
-            self.conn.execute(
-                "UPDATE probe_definitions SET next_run_at = ? WHERE probe_key = ?",
-                (next_run_at, key),
+    def set_probe_next_runs(self, updates: list[tuple[str, int]]) -> None:
+        if not updates:
+            return
+        with self._lock, self._write_conn:
+            self._write_conn.execute("BEGIN IMMEDIATE")
+            self._write_conn.executemany(
+                _SQL_UPDATE_NEXT,
+                [(next_run_us, key) for key, next_run_us in updates],
             )
-            self.conn.commit()
 
-    def save_probe_run(self, key: str, run: dict[str, Any], next_run_at: str) -> None:
-        with self._lock:
-            self.conn.execute(
-                """
-                INSERT INTO probe_runs (
-                    probe_key, started_at, ended_at, ok, status, latency_ms, error, payload_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    key,
-                    run["started_at"],
-                    run["ended_at"],
-                    1 if run["ok"] else 0,
-                    run["status"],
-                    float(run["latency_ms"]),
-                    run.get("error", ""),
-                    json.dumps(run.get("payload", {}), ensure_ascii=True),
-                ),
+    def save_probe_runs(self, runs: list[tuple[str, dict[str, Any], int]]) -> None:
+        if not runs:
+            return
+        with self._lock, self._write_conn:
+            self._write_conn.execute("BEGIN IMMEDIATE")
+            self._write_conn.executemany(
+                _SQL_INSERT_RUN,
+                [
+                    (
+                        key,
+                        run["started_at"],
+                        run["ended_at"],
+                        1 if run["ok"] else 0,
+                        run["status"],
+                        float(run["latency_ms"]),
+                        run.get("error", ""),
+                        dump_json_bytes(run.get("payload", {})).decode("utf-8"),
+                    )
+                    for key, run, _ in runs
+                ],
             )
-            self.conn.execute(
-                """
-                UPDATE probe_definitions
-                SET last_run_at = ?, next_run_at = ?
-                WHERE probe_key = ?
-                """,
-                (run["ended_at"], next_run_at, key),
+            self._write_conn.executemany(
+                _SQL_UPDATE_RUN_TIMES,
+                [(iso_to_epoch_us(run["ended_at"]), next_run_us, key) for key, run, next_run_us in runs],
             )
-            self.conn.commit()
 
-    def get_latest_probes(self, now_iso: str) -> list[dict[str, Any]]:
-        with self._lock:
-            rows = self.conn.execute(
+    def get_latest_probes(self, now_us: int) -> list[dict[str, Any]]:
+        with self._reader() as conn:
+            rows = conn.execute(
                 """
+                WITH latest AS (
+                    SELECT probe_key, MAX(id) AS id
+                    FROM probe_runs
+                    GROUP BY probe_key
+                )
                 SELECT
                     d.probe_key,
                     d.probe_type,
@@ -576,8 +1115,8 @@ class SQLiteStore:
                     d.timeout_seconds,
                     d.stale_after_seconds,
                     d.enabled,
-                    d.next_run_at,
-                    d.last_run_at,
+                    d.next_run_us,
+                    d.last_run_us,
                     r.id AS run_id,
                     r.started_at,
                     r.ended_at,
@@ -587,33 +1126,29 @@ class SQLiteStore:
                     r.error,
                     r.payload_json
                 FROM probe_definitions d
-                LEFT JOIN probe_runs r ON r.id = (
-                    SELECT rr.id
-                    FROM probe_runs rr
-                    WHERE rr.probe_key = d.probe_key
-                    ORDER BY rr.id DESC
-                    LIMIT 1
-                )
+                LEFT JOIN latest l ON l.probe_key = d.probe_key
+                LEFT JOIN probe_runs r ON r.id = l.id
                 ORDER BY d.probe_key
                 """
             ).fetchall()
 
         out: list[dict[str, Any]] = []
-        now_dt = parse_iso(now_iso) or dt.datetime.now(dt.timezone.utc)
         for row in rows:
             payload: dict[str, Any] = {}
             if row["payload_json"]:
                 try:
-                    parsed = json.loads(row["payload_json"])
+                    parsed = load_json_bytes(row["payload_json"])
                     if isinstance(parsed, dict):
                         payload = parsed
-                except json.JSONDecodeError:
+                except ValueError:
                     payload = {}
-            ended = parse_iso(row["ended_at"]) if row["ended_at"] else None
+            # Age follows the run being reported; last_run_us can belong to a different,
+            # concurrently saved run of the same probe.
+            ended_us = iso_to_epoch_us(row["ended_at"])
             stale = True
             age_seconds = None
-            if ended is not None:
-                age_seconds = int((now_dt - ended).total_seconds())
+            if ended_us is not None:
+                age_seconds = (now_us - ended_us) // 1_000_000
                 stale = age_seconds > int(row["stale_after_seconds"])
             out.append(
                 {
@@ -622,8 +1157,8 @@ class SQLiteStore:
                     "enabled": bool(int(row["enabled"])),
                     "interval_seconds": int(row["interval_seconds"]),
                     "stale_after_seconds": int(row["stale_after_seconds"]),
-                    "next_run_at": row["next_run_at"],
-                    "last_run_at": row["last_run_at"],
+                    "next_run_at": epoch_us_to_iso(row["next_run_us"]),
+                    "last_run_at": epoch_us_to_iso(row["last_run_us"]),
                     "latest_run": {
                         "run_id": row["run_id"],
                         "started_at": row["started_at"],
@@ -640,120 +1175,75 @@ class SQLiteStore:
             )
         return out
 
-    def get_probe_history(self, key: str, limit: int) -> list[dict[str, Any]]:
-        with self._lock:
-            rows = self.conn.execute(
-                """
-                SELECT id, probe_key, started_at, ended_at, ok, status, latency_ms, error, payload_json
-                FROM probe_runs
-                WHERE probe_key = ?
-                ORDER BY id DESC
-                LIMIT ?
-                """,
-                (key, limit),
-            ).fetchall()
+    def get_probe_history_json(self, key: str, limit: int, include_payload: bool = True) -> str:
+        with self._reader() as conn:
+            row = conn.execute(_SQL_PROBE_HISTORY_JSON, (1 if include_payload else 0, key, limit)).fetchone()
+        return row[0]
 
-        out: list[dict[str, Any]] = []
-        for row in rows:
-            payload: dict[str, Any] = {}
-            if row["payload_json"]:
-                try:
-                    parsed = json.loads(row["payload_json"])
-                    if isinstance(parsed, dict):
-                        payload = parsed
-                except json.JSONDecodeError:
-                    payload = {}
-            out.append(
-                {
-                    "id": row["id"],
-                    "probe_key": row["probe_key"],
-                    "started_at": row["started_at"],
-                    "ended_at": row["ended_at"],
-                    "ok": bool(int(row["ok"])),
-                    "status": row["status"],
-                    "latency_ms": row["latency_ms"],
-                    "error": row["error"],
-                    "payload": payload,
-                }
+    def add_action_audits(self, rows: list[dict[str, Any]]) -> None:
+        if not rows:
+            return
+        with self._lock, self._write_conn:
+            self._write_conn.execute("BEGIN IMMEDIATE")
+            self._write_conn.executemany(
+                _SQL_INSERT_AUDIT,
+                [
+                    (
+                        row.get("timestamp_utc", now_utc()),
+                        row.get("actor", "unknown"),
+                        row.get("remote_ip", ""),
+                        row.get("target_type", ""),
+                        row.get("target", ""),
+                        row.get("action", ""),
+                        row.get("reason", ""),
+                        1 if row.get("ok") else 0,
+                        row.get("return_code"),
+                        row.get("stderr", ""),
+                    )
+                    for row in rows
+                ],
             )
-        return out
 
-    def add_action_audit(self, row: dict[str, Any]) -> None:
-        with self._lock:
-            self.conn.execute(
-                """
-                INSERT INTO action_audit (
-                    timestamp_utc, actor, remote_ip, target_type, target, action, reason, ok, return_code, stderr
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    row.get("timestamp_utc", now_utc()),
-                    row.get("actor", "unknown"),
-                    row.get("remote_ip", ""),
-                    row.get("target_type", ""),
-                    row.get("target", ""),
-                    row.get("action", ""),
-                    row.get("reason", ""),
-                    1 if row.get("ok") else 0,
-                    row.get("return_code"),
-                    row.get("stderr", ""),
-                ),
-            )
-            self.conn.commit()
+    def read_action_audit_json(self, limit: int) -> str:
+        with self._reader() as conn:
+            row = conn.execute(_SQL_AUDIT_JSON, (limit,)).fetchone()
+        return row[0]
 
-    def read_action_audit(self, limit: int) -> list[dict[str, Any]]:
-        with self._lock:
-            rows = self.conn.execute(
-                """
-                SELECT timestamp_utc, actor, remote_ip, target_type, target, action, reason, ok, return_code, stderr
-                FROM action_audit
-                ORDER BY id DESC
-                LIMIT ?
-                """,
-                (limit,),
-            ).fetchall()
-        return [
-            {
-                "timestamp_utc": r["timestamp_utc"],
-                "actor": r["actor"],
-                "remote_ip": r["remote_ip"],
-                "target_type": r["target_type"],
-                "target": r["target"],
-                "action": r["action"],
-                "reason": r["reason"],
-                "ok": bool(int(r["ok"])),
-                "return_code": r["return_code"],
-                "stderr": r["stderr"],
-            }
-            for r in rows
-        ]
+    def iter_action_audit_ndjson(self, limit: int, batch_size: int = 64) -> Generator[bytes, None, None]:
+        # limit is capped at MAX_AUDIT_LIMIT, so read everything up front and give the
+        # reader back before writing; a slow client must not hold it or pin the WAL.
+        with self._reader() as conn:
+            lines = [r[0] for r in conn.execute(_SQL_AUDIT_ROWS_JSON, (limit,))]
+        for start in range(0, len(lines), batch_size):
+            yield "".join(f"{line}\n" for line in lines[start : start + batch_size]).encode("utf-8")
 
 
 class ProbeRunner:
+    def __init__(self):
+        self._dispatch = {
+            "sms_health": self._probe_sms_health,
+            "nid_health": self._probe_nid_health,
+            "tcp_check": self._probe_tcp,
+            "http_check": self._probe_http,
+        }
+
     def run_probe(self, probe: dict[str, Any]) -> dict[str, Any]:
         started = dt.datetime.now(dt.timezone.utc)
+        started_ns = time.monotonic_ns()
         timeout_seconds = int(probe.get("timeout_seconds", 5))
         probe_type = str(probe.get("type", ""))
-        cfg = probe.get("config", {})
-        if not isinstance(cfg, dict):
-            cfg = {}
+        probe_fn = self._dispatch.get(probe_type)
         result: dict[str, Any]
         try:
-            if probe_type == "sms_health":
-                result = self._probe_sms_health(cfg, timeout_seconds)
-            elif probe_type == "nid_health":
-                result = self._probe_nid_health(cfg, timeout_seconds)
-            elif probe_type == "tcp_check":
-                result = self._probe_tcp(cfg, timeout_seconds)
-            elif probe_type == "http_check":
-                result = self._probe_http(cfg, timeout_seconds)
-            else:
+            if probe_fn is None:
                 result = {
                     "ok": False,
                     "status": "error",
                     "error": f"Unsupported probe type: {probe_type}",
                     "payload": {"probe_type": probe_type},
                 }
+            else:
+                result = probe_fn(probe["config"], timeout_seconds)
         except Exception as ex:  # noqa: BLE001
             result = {
                 "ok": False,
@@ -761,8 +1251,9 @@ class ProbeRunner:
                 "error": str(ex),
                 "payload": {"probe_type": probe_type},
             }
-        ended = dt.datetime.now(dt.timezone.utc)
-        latency_ms = (ended - started).total_seconds() * 1000.0
+        elapsed_ns = time.monotonic_ns() - started_ns
+        ended = started + dt.timedelta(microseconds=elapsed_ns // 1000)
+        latency_ms = elapsed_ns / 1e6
         return {
             "started_at": started.isoformat(),
             "ended_at": ended.isoformat(),
@@ -831,7 +1322,8 @@ class ProbeRunner:
         }
 
     def _psql_scalar(self, dsn: str, query: str, timeout_seconds: int) -> tuple[bool, int | None, str]:
-        cmd = ["psql", dsn, "-At", "-v", "ON_ERROR_STOP=1", "-c", query]
+        cmd = ["psql", dsn, "-qAt", "-v", "ON_ERROR_STOP=1"]
+        cmd += ["-c", f"SET statement_timeout = {max(1, timeout_seconds) * 1000}", "-c", query]
         out = run_cmd(cmd, timeout=max(5, timeout_seconds))
         if not out["ok"]:
             return False, None, out["stderr"] or out["stdout"]
@@ -852,26 +1344,16 @@ class ProbeRunner:
             or "https://api.afromessage.com/api"
         )
         host, port = parse_url_host_port(base_url)
-        tcp = tcp_check(host, port, timeout=min(float(timeout_seconds), 5.0))
-        steps.append({"name": "provider_tcp", "required": True, **tcp})
-
-        http = http_probe(
+        tcp_future = PROBE_EXECUTOR.submit(tcp_check, host, port, timeout=min(float(timeout_seconds), 5.0))
+        http_future = PROBE_EXECUTOR.submit(
+            http_probe,
             url=base_url,
             timeout_seconds=min(float(timeout_seconds), 8.0),
             method="GET",
             allow_4xx=True,
         )
-        steps.append(
-            {
-                "name": "provider_http",
-                "required": True,
-                "ok": bool(http["ok"]),
-                "status_code": http["status_code"],
-                "latency_ms": http["latency_ms"],
-                "error": http["error"],
-            }
-        )
 
+        db_steps: list[dict[str, Any]] = []
         dsn = (
             str(cfg.get("pg_dsn", "")).strip()
             or os.environ.get(str(cfg.get("pg_dsn_env", "RC_PG_DSN")).strip(), "").strip()
@@ -901,8 +1383,11 @@ class ProbeRunner:
                     """,
                 )
             )
+            # Separate psql sessions, so one failing query never masks the other's result.
+            failed_future = PROBE_EXECUTOR.submit(self._psql_scalar, dsn, failed_query, timeout_seconds)
             ok_outbox, outbox_count, outbox_error = self._psql_scalar(dsn, outbox_query, timeout_seconds)
-            steps.append(
+            ok_failed, failed_count, failed_error = failed_future.result()
+            db_steps.append(
                 {
                     "name": "db_outbox_backlog",
                     "required": True,
@@ -912,8 +1397,7 @@ class ProbeRunner:
                     "error": outbox_error,
                 }
             )
-            ok_failed, failed_count, failed_error = self._psql_scalar(dsn, failed_query, timeout_seconds)
-            steps.append(
+            db_steps.append(
                 {
                     "name": "db_failed_recent",
                     "required": True,
@@ -924,7 +1408,7 @@ class ProbeRunner:
                 }
             )
         else:
-            steps.append(
+            db_steps.append(
                 {
                     "name": "db_checks",
                     "required": False,
@@ -934,6 +1418,21 @@ class ProbeRunner:
                 }
             )
 
+        tcp = tcp_future.result()
+        steps.append({"name": "provider_tcp", "required": True, **tcp})
+        http = http_future.result()
+        steps.append(
+            {
+                "name": "provider_http",
+                "required": True,
+                "ok": bool(http["ok"]),
+                "status_code": http["status_code"],
+                "latency_ms": http["latency_ms"],
+                "error": http["error"],
+            }
+        )
+        steps.extend(db_steps)
+
         failed = [s for s in steps if not self._step_ok(s)]
         ok = len(failed) == 0
         return {
@@ -959,59 +1458,38 @@ class ProbeRunner:
         get_data_url = str(cfg.get("get_data_url", "")).strip() or f"{base_url}/nid/getData"
 
         host, port = parse_url_host_port(base_url)
-        tcp = tcp_check(host, port, timeout=min(float(timeout_seconds), 5.0))
-        steps.append({"name": "gateway_tcp", "required": True, **tcp})
-
-        base_http = http_probe(
-            url=base_url,
-            timeout_seconds=min(float(timeout_seconds), 8.0),
-            method="GET",
-            allow_4xx=True,
-        )
-        steps.append(
-            {
-                "name": "gateway_http_base",
-                "required": True,
-                "ok": bool(base_http["ok"]),
-                "status_code": base_http["status_code"],
-                "latency_ms": base_http["latency_ms"],
-                "error": base_http["error"],
-            }
-        )
-
-        req_http = http_probe(
-            url=request_data_url,
-            timeout_seconds=min(float(timeout_seconds), 8.0),
-            method="GET",
-            allow_4xx=True,
-        )
-        steps.append(
-            {
-                "name": "gateway_http_requestData_endpoint",
-                "required": True,
-                "ok": bool(req_http["ok"]),
-                "status_code": req_http["status_code"],
-                "latency_ms": req_http["latency_ms"],
-                "error": req_http["error"],
-            }
-        )
+        tcp_future = PROBE_EXECUTOR.submit(tcp_check, host, port, timeout=min(float(timeout_seconds), 5.0))
+        http_futures = [
+            (
+                name,
+                PROBE_EXECUTOR.submit(
+                    http_probe,
+                    url=url,
+                    timeout_seconds=min(float(timeout_seconds), 8.0),
+                    method="GET",
+                    allow_4xx=True,
+                ),
+            )
+            for name, url in (
+                ("gateway_http_base", base_url),
+                ("gateway_http_requestData_endpoint", request_data_url),
+                ("gateway_http_getData_endpoint", get_data_url),
+            )
+        ]
 
-        get_http = http_probe(
-            url=get_data_url,
-            timeout_seconds=min(float(timeout_seconds), 8.0),
-            method="GET",
-            allow_4xx=True,
-        )
-        steps.append(
-            {
-                "name": "gateway_http_getData_endpoint",
-                "required": True,
-                "ok": bool(get_http["ok"]),
-                "status_code": get_http["status_code"],
-                "latency_ms": get_http["latency_ms"],
-                "error": get_http["error"],
-            }
-        )
+        steps.append({"name": "gateway_tcp", "required": True, **tcp_future.result()})
+        for name, future in http_futures:
+            http = future.result()
+            steps.append(
+                {
+                    "name": name,
+                    "required": True,
+                    "ok": bool(http["ok"]),
+                    "status_code": http["status_code"],
+                    "latency_ms": http["latency_ms"],
+                    "error": http["error"],
+                }
+            )
 
         failed = [s for s in steps if not self._step_ok(s)]
         ok = len(failed) == 0
@@ -1034,32 +1512,56 @@ class RemoteControlApi:
         config_path = Path(os.environ.get("RC_CONFIG_PATH", str(DEFAULT_CONFIG_PATH))).resolve()
         self.config_path = config_path
         self.config = read_json_file(config_path)
+        self._load_targets()
+        self.safe_config = {
+            "targets": self.config.get("targets", {}),
+            "actions": self.config.get("actions", {}),
+            "scheduled_probes": self.config.get("scheduled_probes", []),
+        }
+        self.config_response = dump_json_bytes({"ok": True, "config": self.safe_config})
         self.admin_token = os.environ.get("RC_ADMIN_TOKEN", "").strip()
         self.db_path = Path(os.environ.get("RC_DB_PATH", str(DEFAULT_DB_PATH))).resolve()
         self.store = SQLiteStore(self.db_path)
         self.probe_runner = ProbeRunner()
         self.privileged = PrivilegedHelperClient()
         self.store.sync_probe_definitions(self._configured_scheduled_probes())
+        self.probe_schedule_changed = threading.Event()
+        self.audit_queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=AUDIT_QUEUE_MAX)
         self._disk_cache_lock = threading.Lock()
-        self._disk_cache_at: dt.datetime | None = None
+        self._disk_cache_at: float | None = None
         self._disk_cache_payload: dict[str, Any] | None = None
+        self._disk_inflight: Future[dict[str, Any]] | None = None
+        self._status_cache = TTLCache(
+            max(0.0, env_float("RC_STATUS_CACHE_TTL_SECONDS", DEFAULT_STATUS_CACHE_TTL_SECONDS))
+        )
 
     def require_token(self, provided: str) -> bool:
         if not self.admin_token:
             return False
         return hmac.compare_digest(provided, self.admin_token)
 
-    def _configured_services(self) -> list[str]:
-        return list(self.config.get("targets", {}).get("services", []))
+    def _load_targets(self) -> None:
+        targets = self.config.get("targets", {})
+        self._services = tuple(targets.get("services", []))
+        self._service_set = frozenset(self._services)
+        self._containers = tuple(targets.get("containers", []))
+        self._container_set = frozenset(self._containers)
+        checks = targets.get("tcp_checks", [])
+        self._tcp_checks = tuple(c for c in checks if isinstance(c, dict)) if isinstance(checks, list) else ()
+        actions = self.config.get("actions", {})
+        self._actions = {
+            "service": frozenset(actions.get("service", [])),
+            "container": frozenset(actions.get("container", [])),
+        }
 
-    def _configured_containers(self) -> list[str]:
-        return list(self.config.get("targets", {}).get("containers", []))
+    def _configured_services(self) -> tuple[str, ...]:
+        return self._services
 
-    def _configured_tcp_checks(self) -> list[dict[str, Any]]:
-        checks = self.config.get("targets", {}).get("tcp_checks", [])
-        if isinstance(checks, list):
-            return [c for c in checks if isinstance(c, dict)]
-        return []
+    def _configured_containers(self) -> tuple[str, ...]:
+        return self._containers
+
+    def _configured_tcp_checks(self) -> tuple[dict[str, Any], ...]:
+        return self._tcp_checks
 
     def _configured_scheduled_probes(self) -> list[dict[str, Any]]:
         items = self.config.get("scheduled_probes", [])
@@ -1103,6 +1605,28 @@ class RemoteControlApi:
             "error": "",
         }
 
+    def _service_status_bulk(self, service_names: tuple[str, ...]) -> list[dict[str, Any]]:
+        if not service_names:
+            return []
+        out = run_cmd(["systemctl", "show", *service_names, "--property=ActiveState,SubState,UnitFileState"])
+        blocks = out["stdout"].split("\n\n") if out["ok"] else []
+        if len(blocks) != len(service_names):
+            return [self._service_status(name) for name in service_names]
+
+        statuses: list[dict[str, Any]] = []
+        for name, block in zip(service_names, blocks):
+            props = dict(line.partition("=")[::2] for line in block.splitlines())
+            statuses.append(
+                {
+                    "name": name,
+                    "status": props.get("ActiveState", "unknown"),
+                    "sub_status": props.get("SubState", ""),
+                    "enabled": props.get("UnitFileState", ""),
+                    "error": "",
+                }
+            )
+        return statuses
+
     def _container_status_map(self) -> tuple[dict[str, dict[str, str]], str]:
         return self.privileged.container_status_map()
 
@@ -1369,25 +1893,55 @@ class RemoteControlApi:
             "errors": errors,
         }
 
-    def collect_disk_report(self) -> dict[str, Any]:
+    def _disk_report_future(self) -> Future[dict[str, Any]]:
         config = self._configured_disk_report()
         refresh_seconds = max(5, int(config.get("refresh_seconds", 120)))
-        now_dt = dt.datetime.now(dt.timezone.utc)
-        with self._disk_cache_lock:
-            if self._disk_cache_at and self._disk_cache_payload:
-                age = (now_dt - self._disk_cache_at).total_seconds()
-                if age < refresh_seconds:
-                    return self._disk_cache_payload
-
-        report = self._build_disk_report(now_dt)
+        now_mono = time.monotonic()
         with self._disk_cache_lock:
-            self._disk_cache_at = now_dt
-            self._disk_cache_payload = report
-        return report
+            if self._disk_cache_at is not None and self._disk_cache_payload:
+                if now_mono - self._disk_cache_at < refresh_seconds:
+                    cached: Future[dict[str, Any]] = Future()
+                    cached.set_result(self._disk_cache_payload)
+                    return cached
+            # Single-flight: concurrent callers share the one rebuild already running.
+            if self._disk_inflight is None:
+                self._disk_inflight = DISK_EXECUTOR.submit(self._refresh_disk_report)
+            return self._disk_inflight
+
+    def _refresh_disk_report(self) -> dict[str, Any]:
+        started = time.monotonic()
+        try:
+            report = self._build_disk_report(dt.datetime.now(dt.timezone.utc))
+            with self._disk_cache_lock:
+                self._disk_cache_at = started
+                self._disk_cache_payload = report
+            return report
+        finally:
+            with self._disk_cache_lock:
+                self._disk_inflight = None
 
     def collect_status(self) -> dict[str, Any]:
+        services = self._configured_services()
+        disk_future = self._disk_report_future()
+        container_future = STATUS_EXECUTOR.submit(
+            self._status_cache.get_or_compute, ("container_status_map",), self._container_status_map
+        )
+        service_future = STATUS_EXECUTOR.submit(
+            self._status_cache.get_or_compute,
+            ("systemctl", "show", *services),
+            lambda: self._service_status_bulk(services),
+        )
+        tcp_futures = []
+        for check in self._configured_tcp_checks():
+            host = str(check.get("host", "127.0.0.1"))
+            port = int(check.get("port", 0))
+            if port <= 0:
+                continue
+            future = STATUS_EXECUTOR.submit(tcp_check, host, port, float(check.get("timeout_seconds", 1.5)))
+            tcp_futures.append((str(check.get("name", f"{host}:{port}")), future))
+
         uptime = uptime_seconds()
-        disk_report = self.collect_disk_report()
+        disk_report = disk_future.result()
         root_fs = next((x for x in disk_report.get("filesystems", []) if x.get("mount") == "/"), None)
         if root_fs:
             disk_root = {
@@ -1404,14 +1958,14 @@ class RemoteControlApi:
                 "free_bytes": disk.free,
                 "used_pct": round((disk.used / disk.total * 100.0), 2) if disk.total else 0.0,
             }
-        container_map, container_error = self._container_status_map()
+        container_map, container_error = container_future.result()
         now_iso = now_utc()
 
         payload: dict[str, Any] = {
             "timestamp_utc": now_iso,
-            "host": socket.gethostname(),
+            "host": HOST_NAME,
             "uptime_seconds": uptime,
-            "load_avg": list(os.getloadavg()) if hasattr(os, "getloadavg") else None,
+            "load_avg": list(os.getloadavg()) if _HAS_LOADAVG else None,
             "memory": mem_snapshot(),
             "disk_root": disk_root,
             "disk_report": disk_report,
@@ -1421,11 +1975,10 @@ class RemoteControlApi:
                 "containers": [],
                 "tcp_checks": [],
             },
-            "scheduled_probes": self.store.get_latest_probes(now_iso),
+            "scheduled_probes": self.store.get_latest_probes(now_epoch_us()),
         }
 
-        for name in self._configured_services():
-            payload["targets"]["services"].append(self._service_status(name))
+        payload["targets"]["services"] = service_future.result()
 
         for name in self._configured_containers():
             item = container_map.get(name)
@@ -1450,18 +2003,15 @@ class RemoteControlApi:
                     }
                 )
 
-        for check in self._configured_tcp_checks():
-            host = str(check.get("host", "127.0.0.1"))
-            port = int(check.get("port", 0))
-            if port <= 0:
-                continue
-            result = tcp_check(host, port, float(check.get("timeout_seconds", 1.5)))
-            result["name"] = str(check.get("name", f"{host}:{port}"))
+        for name, future in tcp_futures:
+            result = future.result()
+            result["name"] = name
             payload["targets"]["tcp_checks"].append(result)
+        payload["cache_stats"] = self._status_cache.stats()
         return payload
 
-    def _allowed_actions(self, target_type: str) -> list[str]:
-        return list(self.config.get("actions", {}).get(target_type, []))
+    def _allowed_actions(self, target_type: str) -> frozenset[str]:
+        return self._actions[target_type]
 
     def execute_action(self, actor: str, remote_ip: str, req: dict[str, Any]) -> tuple[int, dict[str, Any]]:
         target_type = str(req.get("target_type", "")).strip()
@@ -1477,15 +2027,14 @@ class RemoteControlApi:
             return 403, {"ok": False, "error": f"Action '{action}' is not allowed for {target_type}."}
 
         if target_type == "service":
-            allowed = set(self._configured_services())
-            if target not in allowed:
+            if target not in self._service_set:
                 return 403, {"ok": False, "error": f"Service '{target}' is not in allowlist."}
         else:
-            allowed = set(self._configured_containers())
-            if target not in allowed:
+            if target not in self._container_set:
                 return 403, {"ok": False, "error": f"Container '{target}' is not in allowlist."}
 
         result = self.privileged.execute_action(target_type=target_type, action=action, target=target)
+        self._status_cache.invalidate()
         response = {
             "ok": result["ok"],
             "target_type": target_type,
@@ -1497,32 +2046,38 @@ class RemoteControlApi:
             "return_code": result["return_code"],
             "timestamp_utc": now_utc(),
         }
-        self.store.add_action_audit(
-            {
-                "timestamp_utc": response["timestamp_utc"],
-                "actor": actor,
-                "remote_ip": remote_ip,
-                "target_type": target_type,
-                "target": target,
-                "action": action,
-                "reason": reason,
-                "ok": result["ok"],
-                "return_code": result["return_code"],
-                "stderr": result["stderr"],
-            }
-        )
+        audit = {
+            "timestamp_utc": response["timestamp_utc"],
+            "actor": actor,
+            "remote_ip": remote_ip,
+            "target_type": target_type,
+            "target": target,
+            "action": action,
+            "reason": reason,
+            "ok": result["ok"],
+            "return_code": result["return_code"],
+            "stderr": result["stderr"],
+        }
+        try:
+            self.audit_queue.put_nowait(audit)
+        except queue.Full:
+            self.store.add_action_audits([audit])
         return (200 if result["ok"] else 500), response
 
-    def read_audit(self, limit: int) -> list[dict[str, Any]]:
-        return self.store.read_action_audit(limit)
+    def read_audit_json(self, limit: int) -> str:
+        return self.store.read_action_audit_json(limit)
+
+    def iter_audit_ndjson(self, limit: int) -> Generator[bytes, None, None]:
+        return self.store.iter_action_audit_ndjson(limit)
 
     def run_probe_once(self, key: str) -> tuple[int, dict[str, Any]]:
         probe = self.store.get_probe_definition(key)
         if not probe:
             return 404, {"ok": False, "error": f"Probe '{key}' not found."}
         run = self.probe_runner.run_probe(probe)
-        next_time = (dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=probe["interval_seconds"])).isoformat()
-        self.store.save_probe_run(key, run, next_time)
+        next_us = now_epoch_us() + probe["interval_seconds"] * 1_000_000
+        self.store.save_probe_runs([(key, run, next_us)])
+        self.probe_schedule_changed.set()
         return 200, {"ok": True, "probe_key": key, "run": run}
 
 
@@ -1531,20 +2086,141 @@ class ProbeScheduler(threading.Thread):
         super().__init__(daemon=True, name="rc-probe-scheduler")
         self.api = api
         self.stop_event = threading.Event()
-        self.tick_seconds = max(1.0, env_float("RC_PROBE_TICK_SECONDS", 2.0))
+        self.wake_event = api.probe_schedule_changed
+        self._probes: dict[str, dict[str, Any]] = {}
+        self._heap: list[tuple[int, str]] = []
+        self._running: set[str] = set()
+        self._running_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, env_int("RC_PROBE_WORKERS", DEFAULT_PROBE_WORKERS)),
+            thread_name_prefix="rc-probe-run",
+        )
+
+    def _reload(self) -> None:
+        self.wake_event.clear()
+        schedule = self.api.store.list_probe_schedule()
+        self._probes = {str(p["key"]): p for _, p in schedule}
+        self._heap = [(next_us, str(p["key"])) for next_us, p in schedule]
+        heapq.heapify(self._heap)
+
+    def run(self) -> None:
+        self._reload()
+        while not self.stop_event.is_set():
+            if self.wake_event.is_set():
+                self._reload()
+                continue
+            if not self._heap:
+                self.wake_event.wait()
+                continue
+            now_us = now_epoch_us()
+            delay_us = self._heap[0][0] - now_us
+            if delay_us > 0:
+                self.wake_event.wait(delay_us / 1_000_000)
+                continue
+
+            scheduled: list[tuple[dict[str, Any], int]] = []
+            while self._heap and self._heap[0][0] <= now_us:
+                _, key = heapq.heappop(self._heap)
+                probe = self._probes[key]
+                next_at = now_us + int(probe.get("interval_seconds", 60)) * 1_000_000
+                heapq.heappush(self._heap, (next_at, key))
+                with self._running_lock:
+                    if key in self._running:
+                        continue
+                    self._running.add(key)
+                scheduled.append((probe, next_at))
+            self.api.store.set_probe_next_runs([(str(p["key"]), next_at) for p, next_at in scheduled])
+            for probe, next_at in scheduled:
+                self._executor.submit(self._run_and_save, probe, next_at)
+
+    def _run_and_save(self, probe: dict[str, Any], next_at: int) -> None:
+        key = str(probe["key"])
+        try:
+            run = self.api.probe_runner.run_probe(probe)
+            self.api.store.save_probe_runs([(key, run, next_at)])
+        except sqlite3.Error as ex:
+            print(f"[rc-control] saving probe run for {key} failed: {ex}", flush=True)
+        finally:
+            with self._running_lock:
+                self._running.discard(key)
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        self.wake_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class WalCheckpointer(threading.Thread):
+    def __init__(self, store: SQLiteStore):
+        super().__init__(daemon=True, name="rc-wal-checkpoint")
+        self.store = store
+        self.stop_event = threading.Event()
+        self.interval_seconds = max(1.0, env_float("RC_WAL_CHECKPOINT_SECONDS", 30.0))
+        self.threshold_bytes = max(1024 * 1024, env_int("RC_WAL_CHECKPOINT_BYTES", DEFAULT_WAL_CHECKPOINT_BYTES))
+
+    def run(self) -> None:
+        while not self.stop_event.wait(self.interval_seconds):
+            try:
+                self.store.checkpoint_wal(self.threshold_bytes)
+            except sqlite3.Error as ex:
+                print(f"[rc-control] wal checkpoint failed: {ex}", flush=True)
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+
+class RetentionPruner(threading.Thread):
+    def __init__(self, store: SQLiteStore):
+        super().__init__(daemon=True, name="rc-retention")
+        self.store = store
+        self.stop_event = threading.Event()
+        self.interval_seconds = max(60.0, env_float("RC_PRUNE_INTERVAL_SECONDS", 600.0))
+        self.keep_runs = max(10, env_int("RC_PROBE_RUNS_KEEP", DEFAULT_PROBE_RUNS_KEEP))
+        self.keep_audit = max(100, env_int("RC_AUDIT_KEEP", DEFAULT_AUDIT_KEEP))
+
+    def run(self) -> None:
+        while not self.stop_event.wait(self.interval_seconds):
+            try:
+                self.store.prune(self.keep_runs, self.keep_audit)
+            except sqlite3.Error as ex:
+                print(f"[rc-control] retention prune failed: {ex}", flush=True)
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+
+class AuditWriter(threading.Thread):
+    def __init__(self, api: RemoteControlApi):
+        super().__init__(daemon=True, name="rc-audit-writer")
+        self.store = api.store
+        self.audit_queue = api.audit_queue
+        self.stop_event = threading.Event()
+
+    def _drain(self, first: dict[str, Any]) -> None:
+        batch = [first]
+        while len(batch) < AUDIT_BATCH_MAX:
+            try:
+                batch.append(self.audit_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            self.store.add_action_audits(batch)
+        except sqlite3.Error as ex:
+            print(f"[rc-control] audit write of {len(batch)} rows failed: {ex}", flush=True)
 
     def run(self) -> None:
         while not self.stop_event.is_set():
-            now_iso = now_utc()
-            due = self.api.store.list_due_probes(now_iso)
-            for probe in due:
-                key = str(probe["key"])
-                interval_seconds = int(probe.get("interval_seconds", 60))
-                tentative_next = (dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=interval_seconds)).isoformat()
-                self.api.store.set_probe_next_run(key, tentative_next)
-                run = self.api.probe_runner.run_probe(probe)
-                self.api.store.save_probe_run(key, run, tentative_next)
-            self.stop_event.wait(self.tick_seconds)
+            try:
+                first = self.audit_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            self._drain(first)
+        while True:
+            try:
+                first = self.audit_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._drain(first)
 
     def stop(self) -> None:
         self.stop_event.set()
@@ -1552,20 +2228,67 @@ class ProbeScheduler(threading.Thread):
 
 API = RemoteControlApi()
 SCHEDULER = ProbeScheduler(API)
+AUDITOR = AuditWriter(API)
+CHECKPOINTER = WalCheckpointer(API.store)
+PRUNER = RetentionPruner(API.store)
+
+
+_health_cache: tuple[int, bytes] = (0, b"")
 
 
 class Handler(BaseHTTPRequestHandler):
     server_version = "DireRemoteControl/0.2"
+    protocol_version = "HTTP/1.1"
+    timeout = max(1.0, env_float("RC_HTTP_KEEPALIVE_SECONDS", DEFAULT_HTTP_KEEPALIVE_SECONDS))
+    max_body_bytes = env_int("RC_MAX_BODY_BYTES", 16384)
 
     def _send(self, status: int, payload: dict[str, Any]) -> None:
-        blob = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._send_raw(status, dump_json_bytes(payload))
+
+    def _send_and_close(self, status: int, payload: dict[str, Any]) -> None:
+        self.close_connection = True
+        self._send(status, payload)
+
+    def _send_connection_headers(self) -> None:
+        if not self.close_connection and not self.server.keepalive_allowed():
+            self.close_connection = True
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        else:
+            self.send_header("Connection", "keep-alive")
+            self.send_header("Keep-Alive", f"timeout={int(self.timeout)}")
+
+    def _send_raw(self, status: int, blob: bytes) -> None:
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(blob)))
         self.send_header("Cache-Control", "no-store")
+        self._send_connection_headers()
         self.end_headers()
         self.wfile.write(blob)
 
+    def _send_ndjson(self, chunks: Generator[bytes, None, None]) -> None:
+        chunked = self.request_version == "HTTP/1.1"
+        if not chunked:
+            self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Cache-Control", "no-store")
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        self._send_connection_headers()
+        self.end_headers()
+        try:
+            for chunk in chunks:
+                self.wfile.write(b"%x\r\n%b\r\n" % (len(chunk), chunk) if chunked else chunk)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+        except Exception:
+            self.close_connection = True
+            raise
+        finally:
+            chunks.close()
+
     def _token_ok(self) -> bool:
         if self.path.startswith("/api/v1/health"):
             return True
@@ -1575,97 +2298,125 @@ class Handler(BaseHTTPRequestHandler):
     def _forbidden(self) -> None:
         self._send(401, {"ok": False, "error": "Unauthorized"})
 
+    def _query(self, query: str) -> dict[str, str] | None:
+        params: dict[str, str] = {}
+        try:
+            pairs = parse_qsl(query, max_num_fields=MAX_QUERY_FIELDS)
+        except ValueError:
+            self._send(400, {"ok": False, "error": "Too many query parameters"})
+            return None
+        for name, value in pairs:
+            params.setdefault(name, value)
+        return params
+
+    def _send_cached_health(self) -> None:
+        global _health_cache
+        now_s = int(time.time())
+        cached_s, body = _health_cache
+        if cached_s != now_s:
+            body = HEALTH_TEMPLATE % now_utc().encode("ascii")
+            _health_cache = (now_s, body)
+        self._send_raw(200, body)
+
     def do_GET(self):  # noqa: N802
+        if self.path == "/api/v1/health":
+            self._send_cached_health()
+            return
         if not self._token_ok():
             self._forbidden()
             return
 
-        parsed = urlparse(self.path)
-        path = parsed.path
-        query = parse_qs(parsed.query or "")
-
-        if path == "/api/v1/health":
-            self._send(200, {"ok": True, "timestamp_utc": now_utc()})
+        path, _, query = self.path.partition("?")
+        handler = _GET_ROUTES.get(path)
+        if handler is None:
+            self._send(404, {"ok": False, "error": "Not found"})
             return
+        handler(self, query)
 
-        if path == "/api/v1/status":
-            try:
-                self._send(200, {"ok": True, "data": API.collect_status()})
-            except Exception as ex:  # noqa: BLE001
-                self._send(500, {"ok": False, "error": str(ex)})
-            return
+    def _get_health(self, query: str) -> None:
+        self._send_raw(200, HEALTH_TEMPLATE % now_utc().encode("ascii"))
 
-        if path == "/api/v1/audit":
-            raw_limit = query.get("limit", ["100"])[0]
-            try:
-                limit = max(1, min(MAX_AUDIT_LIMIT, int(raw_limit)))
-            except ValueError:
-                limit = 100
-            self._send(200, {"ok": True, "rows": API.read_audit(limit)})
-            return
+    def _get_status(self, query: str) -> None:
+        try:
+            self._send(200, {"ok": True, "data": API.collect_status()})
+        except Exception as ex:  # noqa: BLE001
+            self._send(500, {"ok": False, "error": str(ex)})
 
-        if path == "/api/v1/probes/history":
-            key = query.get("key", [""])[0].strip()
-            if not key:
-                self._send(400, {"ok": False, "error": "Query parameter 'key' is required."})
-                return
-            raw_limit = query.get("limit", ["50"])[0]
-            try:
-                limit = max(1, min(500, int(raw_limit)))
-            except ValueError:
-                limit = 50
-            rows = API.store.get_probe_history(key, limit)
-            self._send(200, {"ok": True, "probe_key": key, "rows": rows})
+    def _get_audit(self, query: str) -> None:
+        params = self._query(query)
+        if params is None:
             return
-
-        if path == "/api/v1/config":
-            safe_config = {
-                "targets": API.config.get("targets", {}),
-                "actions": API.config.get("actions", {}),
-                "scheduled_probes": API.config.get("scheduled_probes", []),
-            }
-            self._send(200, {"ok": True, "config": safe_config})
+        try:
+            limit = max(1, min(MAX_AUDIT_LIMIT, int(params.get("limit", "100"))))
+        except ValueError:
+            limit = 100
+        if params.get("format") == "ndjson":
+            self._send_ndjson(API.iter_audit_ndjson(limit))
             return
+        rows_json = API.read_audit_json(limit)
+        self._send_raw(200, AUDIT_TEMPLATE % rows_json.encode("utf-8"))
 
-        self._send(404, {"ok": False, "error": "Not found"})
-
-    def do_POST(self):  # noqa: N802
-        if not self._token_ok():
-            self._forbidden()
+    def _get_probe_history(self, query: str) -> None:
+        params = self._query(query)
+        if params is None:
             return
-
-        parsed = urlparse(self.path)
-        if parsed.path not in ("/api/v1/action", "/api/v1/probes/run"):
-            self._send(404, {"ok": False, "error": "Not found"})
+        key = params.get("key", "").strip()
+        if not key:
+            self._send(400, {"ok": False, "error": "Query parameter 'key' is required."})
             return
+        try:
+            limit = max(1, min(500, int(params.get("limit", "50"))))
+        except ValueError:
+            limit = 50
+        include_payload = params.get("include_payload", "1").strip().lower() not in ("0", "false", "no")
+        rows_json = API.store.get_probe_history_json(key, limit, include_payload)
+        self._send_raw(200, PROBE_HISTORY_TEMPLATE % (dump_json_bytes(key), rows_json.encode("utf-8")))
 
-        body_len = env_int("RC_MAX_BODY_BYTES", 16384)
+    def _get_config(self, query: str) -> None:
+        self._send_raw(200, API.config_response)
+
+    def _read_json_body(self) -> dict[str, Any] | None:
         raw_length = self.headers.get("Content-Length", "0")
         try:
             length = int(raw_length)
         except ValueError:
-            self._send(400, {"ok": False, "error": "Invalid content-length"})
-            return
-        if length <= 0 or length > body_len:
-            self._send(400, {"ok": False, "error": "Invalid request body size"})
-            return
+            self._send_and_close(400, {"ok": False, "error": "Invalid content-length"})
+            return None
+        if length <= 0 or length > self.max_body_bytes:
+            self._send_and_close(400, {"ok": False, "error": "Invalid request body size"})
+            return None
 
         raw = self.rfile.read(length)
         try:
-            payload = json.loads(raw.decode("utf-8"))
+            payload = load_json_bytes(raw)
         except Exception:
             self._send(400, {"ok": False, "error": "Invalid JSON payload"})
-            return
+            return None
         if not isinstance(payload, dict):
             self._send(400, {"ok": False, "error": "Payload must be an object"})
+            return None
+        return payload
+
+    def do_POST(self):  # noqa: N802
+        if not self._token_ok():
+            self._send_and_close(401, {"ok": False, "error": "Unauthorized"})
             return
 
-        actor = self.headers.get("X-RC-Actor", "").strip() or "unknown"
-        ip = self.client_address[0]
-        if parsed.path == "/api/v1/action":
-            status, response = API.execute_action(actor=actor, remote_ip=ip, req=payload)
-            self._send(status, response)
+        handler = _POST_ROUTES.get(self.path.partition("?")[0])
+        if handler is None:
+            self._send_and_close(404, {"ok": False, "error": "Not found"})
+            return
+        payload = self._read_json_body()
+        if payload is None:
             return
+        handler(self, payload)
+
+    def _post_action(self, payload: dict[str, Any]) -> None:
+        actor = self.headers.get("X-RC-Actor", "").strip() or "unknown"
+        status, response = API.execute_action(actor=actor, remote_ip=self.client_address[0], req=payload)
+        self._send(status, response)
+
+    def _post_probe_run(self, payload: dict[str, Any]) -> None:
         key = str(payload.get("key", "")).strip()
         if not key:
             self._send(400, {"ok": False, "error": "Probe key is required."})
@@ -1677,20 +2428,76 @@ class Handler(BaseHTTPRequestHandler):
         return
 
 
+_GET_ROUTES = {
+    "/api/v1/health": Handler._get_health,
+    "/api/v1/status": Handler._get_status,
+    "/api/v1/audit": Handler._get_audit,
+    "/api/v1/probes/history": Handler._get_probe_history,
+    "/api/v1/config": Handler._get_config,
+}
+
+
+_POST_ROUTES = {
+    "/api/v1/action": Handler._post_action,
+    "/api/v1/probes/run": Handler._post_probe_run,
+}
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    request_queue_size = 128
+
+    def __init__(self, server_address: tuple[str, int], handler_cls: type[BaseHTTPRequestHandler], max_workers: int):
+        super().__init__(server_address, handler_cls)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rc-http")
+        # An idle keep-alive connection parks a worker until its timeout, so stop
+        # offering keep-alive once most workers are taken and keep headroom for new clients.
+        self.keepalive_limit = max(1, max_workers * 3 // 4)
+        self._open_connections = 0
+        self._open_lock = threading.Lock()
+
+    def keepalive_allowed(self) -> bool:
+        return self._open_connections <= self.keepalive_limit
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self._open_lock:
+            self._open_connections += 1
+        self._pool.submit(self._process_counted, request, client_address)
+
+    def _process_counted(self, request: Any, client_address: Any) -> None:
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            with self._open_lock:
+                self._open_connections -= 1
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
 def main() -> None:
     host = os.environ.get("RC_BIND_HOST", DEFAULT_BIND_HOST).strip() or DEFAULT_BIND_HOST
     port = env_int("RC_BIND_PORT", DEFAULT_BIND_PORT)
     SCHEDULER.start()
-    srv = ThreadingHTTPServer((host, port), Handler)
+    AUDITOR.start()
+    CHECKPOINTER.start()
+    PRUNER.start()
+    workers = max(1, env_int("RC_HTTP_WORKERS", DEFAULT_HTTP_WORKERS))
+    srv = PooledHTTPServer((host, port), Handler, workers)
     print(
-        f"[rc-control] listening on {host}:{port} config={API.config_path} sqlite={API.db_path}",
+        f"[rc-control] listening on {host}:{port} workers={workers} config={API.config_path} sqlite={API.db_path}",
         flush=True,
     )
     try:
         srv.serve_forever()
     finally:
+        srv.server_close()
         SCHEDULER.stop()
         SCHEDULER.join(timeout=5)
+        AUDITOR.stop()
+        AUDITOR.join(timeout=5)
+        CHECKPOINTER.stop()
+        PRUNER.stop()
 
 
 if __name__ == "__main__":
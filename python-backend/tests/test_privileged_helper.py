@@ -0,0 +1,136 @@
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_TMP = Path(tempfile.mkdtemp(prefix="rc-helper-test-"))
+_CONFIG_PATH = _TMP / "config.json"
+_CONFIG_PATH.write_text(json.dumps({"targets": {}, "actions": {"container": ["restart"]}}))
+os.environ["RC_CONFIG_PATH"] = str(_CONFIG_PATH)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import privileged_helper as helper  # noqa: E402
+
+
+def _recv(payload: bytes, max_body: int = 1024, chunks: int = 1) -> object:
+    async def run() -> object:
+        ours, theirs = socket.socketpair()
+        ours.setblocking(False)
+        with ours, theirs:
+            step = max(1, len(payload) // chunks)
+            for start in range(0, len(payload), step):
+                theirs.sendall(payload[start : start + step])
+            theirs.shutdown(socket.SHUT_WR)
+            return await helper._recv_request(ours, max_body)
+
+    return asyncio.run(run())
+
+
+def _frame(body: bytes) -> bytes:
+    return helper.FRAME_HEADER.pack(len(body)) + body
+
+
+class RecvRequestTest(unittest.TestCase):
+    def test_legacy_newline_request(self):
+        self.assertEqual(_recv(b'{"op":"container_status_map"}\n'), {"op": "container_status_map"})
+
+    def test_legacy_request_without_newline(self):
+        self.assertEqual(_recv(b'{"op":"x"}'), {"op": "x"})
+
+    def test_framed_request(self):
+        self.assertEqual(_recv(_frame(b'{"op":"x","target":"a\\nb"}')), {"op": "x", "target": "a\nb"})
+
+    def test_framed_request_split_across_reads(self):
+        body = json.dumps({"op": "x", "pad": "y" * 500}).encode()
+        self.assertEqual(_recv(_frame(body), chunks=7)["pad"], "y" * 500)
+
+    def test_truncated_frame(self):
+        self.assertEqual(_recv(_frame(b'{"op":"x"}')[:-2]), helper._ERR_INVALID_JSON)
+
+    def test_oversized_requests(self):
+        self.assertEqual(_recv(_frame(b"x" * 2000)), helper._ERR_TOO_LARGE)
+        self.assertEqual(_recv(b"x" * 2000 + b"\n"), helper._ERR_TOO_LARGE)
+
+    def test_invalid_payloads(self):
+        self.assertEqual(_recv(b"garbage\n"), helper._ERR_INVALID_JSON)
+        self.assertEqual(_recv(b"[1]\n"), helper._ERR_NOT_OBJECT)
+
+    def test_empty_connection(self):
+        self.assertIsNone(_recv(b""))
+
+    def test_max_body_is_clamped_below_frame_sniff_limit(self):
+        with mock.patch.dict(os.environ, {"RC_HELPER_MAX_BODY_BYTES": str(1 << 30)}):
+            limit = helper.max_request_body()
+        self.assertEqual(limit, helper.MAX_FRAME_BODY_BYTES)
+        self.assertEqual(helper.FRAME_HEADER.pack(limit)[0], 0)
+        with mock.patch.dict(os.environ, {"RC_HELPER_MAX_BODY_BYTES": "10"}):
+            self.assertEqual(helper.max_request_body(), 1024)
+
+
+class ContainerStatusCacheTest(unittest.TestCase):
+    def setUp(self):
+        with mock.patch.dict(os.environ, {"RC_CONFIG_PATH": str(_CONFIG_PATH)}):
+            self.api = helper.PrivilegedApi()
+        self.api._status_ttl = 60.0
+        self.api._containers = frozenset({"web"})
+        self.fetches = 0
+        self.state = "Exited"
+
+        async def fetch() -> dict:
+            self.fetches += 1
+            state = self.state
+            await asyncio.sleep(0.05)
+            return {"ok": True, "containers": {"web": {"status": state}}}
+
+        self.api._fetch_container_status_map = fetch
+
+    async def _action(self) -> dict:
+        async def run_cmd(*_args, **_kwargs) -> dict:
+            self.state = "Up"
+            return {"ok": True}
+
+        with mock.patch.object(helper, "run_cmd", run_cmd):
+            return await self.api.execute({"op": "container_action", "action": "restart", "target": "web"})
+
+    def test_concurrent_misses_share_one_fetch(self):
+        async def run() -> list:
+            return await asyncio.gather(*(self.api._container_status_map() for _ in range(5)))
+
+        results = asyncio.run(run())
+        self.assertEqual(self.fetches, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        asyncio.run(self.api._container_status_map())
+        self.assertEqual(self.fetches, 1)
+
+    def test_action_discards_fetch_in_flight(self):
+        async def run() -> tuple:
+            early = asyncio.ensure_future(self.api._container_status_map())
+            await asyncio.sleep(0.01)
+            await self._action()
+            later = await self.api._container_status_map()
+            return await early, later
+
+        early, later = asyncio.run(run())
+        self.assertEqual(early["containers"]["web"]["status"], "Exited")
+        self.assertEqual(later["containers"]["web"]["status"], "Up")
+        cached = asyncio.run(self.api._container_status_map())
+        self.assertEqual(cached["containers"]["web"]["status"], "Up")
+        self.assertEqual(self.fetches, 2)
+
+    def test_invalidation_reaches_forked_workers(self):
+        before = self.api._current_generation()
+        pid = os.fork()
+        if pid == 0:
+            self.api._invalidate_status()
+            os._exit(0)
+        os.waitpid(pid, 0)
+        self.assertNotEqual(self.api._current_generation(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
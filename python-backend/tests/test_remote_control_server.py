@@ -0,0 +1,222 @@
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+_TMP = Path(tempfile.mkdtemp(prefix="rc-server-test-"))
+(_TMP / "config.json").write_text(json.dumps({"targets": {}}))
+os.environ["RC_CONFIG_PATH"] = str(_TMP / "config.json")
+os.environ["RC_DB_PATH"] = str(_TMP / "api.sqlite3")
+os.environ["RC_ADMIN_TOKEN"] = "test-token"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import remote_control_server as server  # noqa: E402
+
+
+# Schema as created by the original release, before user_version was tracked.
+_BASELINE_SCHEMA = """
+CREATE TABLE probe_definitions (
+    probe_key TEXT PRIMARY KEY,
+    probe_type TEXT NOT NULL,
+    interval_seconds INTEGER NOT NULL,
+    timeout_seconds INTEGER NOT NULL,
+    stale_after_seconds INTEGER NOT NULL,
+    enabled INTEGER NOT NULL,
+    probe_config_json TEXT NOT NULL,
+    next_run_at TEXT,
+    last_run_at TEXT
+);
+CREATE TABLE probe_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    probe_key TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    ended_at TEXT NOT NULL,
+    ok INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    latency_ms REAL NOT NULL,
+    error TEXT,
+    payload_json TEXT NOT NULL
+);
+CREATE INDEX idx_probe_runs_probe_key_id ON probe_runs(probe_key, id DESC);
+CREATE TABLE action_audit (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp_utc TEXT NOT NULL,
+    actor TEXT,
+    remote_ip TEXT,
+    target_type TEXT,
+    target TEXT,
+    action TEXT,
+    reason TEXT,
+    ok INTEGER NOT NULL,
+    return_code INTEGER,
+    stderr TEXT
+);
+CREATE INDEX idx_action_audit_time ON action_audit(timestamp_utc DESC);
+"""
+
+
+class SchemaMigrationTest(unittest.TestCase):
+    def test_baseline_database_migrates_to_current_version(self):
+        path = _TMP / "baseline.sqlite3"
+        conn = sqlite3.connect(path)
+        conn.executescript(_BASELINE_SCHEMA)
+        conn.execute(
+            "INSERT INTO probe_definitions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                "db",
+                "tcp_check",
+                60,
+                5,
+                180,
+                1,
+                '{"host": "127.0.0.1", "port": 5432}',
+                "2030-01-02T03:04:05.000006+00:00",
+                "2030-01-02T03:03:05+00:00",
+            ),
+        )
+        conn.execute(
+            "INSERT INTO probe_runs (probe_key, started_at, ended_at, ok, status, latency_ms, error, payload_json)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            ("db", "2030-01-02T03:03:04+00:00", "2030-01-02T03:03:05+00:00", 1, "healthy", 1.5, "", '{"ok": true}'),
+        )
+        conn.execute(
+            "INSERT INTO action_audit (timestamp_utc, actor, remote_ip, target_type, target, action, reason, ok,"
+            " return_code, stderr) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ("2030-01-02T03:00:00+00:00", "ops", "127.0.0.1", "service", "nginx", "restart", "", 1, 0, ""),
+        )
+        conn.commit()
+        conn.close()
+
+        store = server.SQLiteStore(path)
+        version = store._write_conn.execute("PRAGMA user_version;").fetchone()[0]
+        self.assertEqual(version, server.SCHEMA_VERSION)
+
+        ((next_run_us, probe),) = store.list_probe_schedule()
+        self.assertEqual(next_run_us, server.iso_to_epoch_us("2030-01-02T03:04:05.000006+00:00"))
+        self.assertEqual(probe["config"], {"host": "127.0.0.1", "port": 5432})
+        self.assertEqual(probe["last_run_at"], "2030-01-02T03:03:05+00:00")
+
+        (latest,) = store.get_latest_probes(server.iso_to_epoch_us("2030-01-02T03:04:05+00:00"))
+        self.assertEqual(latest["latest_run"]["status"], "healthy")
+        self.assertEqual(latest["latest_run"]["payload"], {"ok": True})
+        self.assertEqual(latest["age_seconds"], 60)
+        self.assertFalse(latest["is_stale"])
+
+        (audit,) = json.loads(store.read_action_audit_json(10))
+        self.assertEqual((audit["target"], audit["action"]), ("nginx", "restart"))
+
+        # Reopening a current database is a no-op.
+        server.SQLiteStore(path)
+
+
+class TTLCacheTest(unittest.TestCase):
+    def test_concurrent_misses_share_one_compute(self):
+        cache = server.TTLCache(60)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("k", compute))) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(cache.stats(), {"hits": 5, "misses": 1, "entries": 1})
+
+    def test_invalidate_discards_compute_in_flight(self):
+        cache = server.TTLCache(60)
+        state = ["before"]
+
+        def compute():
+            value = state[0]
+            time.sleep(0.1)
+            return value
+
+        early = []
+        worker = threading.Thread(target=lambda: early.append(cache.get_or_compute("k", compute)))
+        worker.start()
+        time.sleep(0.02)
+        state[0] = "after"
+        cache.invalidate()
+        self.assertEqual(cache.get_or_compute("k", compute), "after")
+        worker.join()
+        self.assertEqual(early, ["before"])
+        self.assertEqual(cache.get_or_compute("k", compute), "after")
+
+    def test_entries_expire(self):
+        cache = server.TTLCache(0)
+        values = iter([1, 2])
+        self.assertEqual(cache.get_or_compute("k", lambda: next(values)), 1)
+        self.assertEqual(cache.get_or_compute("k", lambda: next(values)), 2)
+
+
+def _cmd_result(ok: bool, stdout: str = "", stderr: str = "") -> dict:
+    return {"ok": ok, "return_code": 0 if ok else 3, "stdout": stdout, "stderr": stderr, "command": []}
+
+
+class PsqlScalarTest(unittest.TestCase):
+    def setUp(self):
+        self.runner = server.ProbeRunner()
+
+    def _scalar(self, result: dict) -> tuple:
+        with mock.patch.object(server, "run_cmd", return_value=result) as run_cmd:
+            out = self.runner._psql_scalar("postgresql://x", "SELECT 1;", 4)
+        cmd = run_cmd.call_args.args[0]
+        self.assertIn("SET statement_timeout = 4000", cmd)
+        self.assertEqual(cmd[-1], "SELECT 1;")
+        return out
+
+    def test_scalar_parsing(self):
+        self.assertEqual(self._scalar(_cmd_result(True, "12\n")), (True, 12, ""))
+        self.assertEqual(self._scalar(_cmd_result(True, "")), (False, None, "No scalar result"))
+        self.assertEqual(self._scalar(_cmd_result(True, "abc")), (False, None, "Non-integer scalar result: abc"))
+        self.assertEqual(self._scalar(_cmd_result(False, stderr="ERROR: boom")), (False, None, "ERROR: boom"))
+
+    def test_failed_query_does_not_mask_the_other(self):
+        def run_cmd(cmd, timeout=20):
+            if "Outbox" in cmd[-1]:
+                return _cmd_result(False, stderr='ERROR: relation "cis_sms" does not exist')
+            return _cmd_result(True, "3\n")
+
+        healthy = {"ok": True, "status_code": 200, "latency_ms": 1.0, "error": ""}
+        with (
+            mock.patch.object(server, "run_cmd", side_effect=run_cmd),
+            mock.patch.object(server, "tcp_check", return_value={"ok": True, "error": ""}),
+            mock.patch.object(server, "http_probe", return_value=healthy),
+        ):
+            result = self.runner._probe_sms_health({"pg_dsn": "postgresql://x"}, 4)
+        steps = {s["name"]: s for s in result["payload"]["steps"]}
+        self.assertFalse(steps["db_outbox_backlog"]["ok"])
+        self.assertIn("does not exist", steps["db_outbox_backlog"]["error"])
+        self.assertTrue(steps["db_failed_recent"]["ok"])
+        self.assertEqual(steps["db_failed_recent"]["value"], 3)
+        self.assertEqual(steps["db_failed_recent"]["error"], "")
+
+
+class RunCmdTest(unittest.TestCase):
+    def test_output_over_cap_fails_the_command(self):
+        out = server.run_cmd(["sh", "-c", f"head -c {server.MAX_CMD_OUTPUT_BYTES + 1} /dev/zero"])
+        self.assertFalse(out["ok"])
+        self.assertTrue(out["truncated"])
+        self.assertEqual(out["stdout"], "")
+
+    def test_output_at_cap_is_kept(self):
+        out = server.run_cmd(["sh", "-c", f"head -c {server.MAX_CMD_OUTPUT_BYTES} /dev/zero | tr '\\0' x"])
+        self.assertTrue(out["ok"])
+        self.assertEqual(len(out["stdout"]), server.MAX_CMD_OUTPUT_BYTES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import privileged_helper as helper  # noqa: E402
+
+
+class _Message:
+    def __init__(self, body=None):
+        self.body = body
+
+    def is_empty(self) -> bool:
+        return self.body is None
+
+    def process_reply(self, _headers: bool) -> None:
+        pass
+
+
+class _FakeBus:
+    """Stands in for pystemd's DBus: queued jobs report JobRemoved after a delay."""
+
+    def __init__(self):
+        self._read_fd, self._write_fd = os.pipe()
+        self._pending: list[tuple[float, list]] = []
+        self._pending_lock = threading.Lock()
+        self.on_job_removed = None
+        self.match = None
+        self.closed = False
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def get_fd(self) -> int:
+        return self._read_fd
+
+    def match_signal(self, sender, path, interface, member, callback) -> None:
+        self.match = (sender, path, interface, member)
+        self.on_job_removed = callback
+
+    def queue_job(self, job_path: bytes, unit: bytes, result: bytes | None, delay: float) -> None:
+        if result is None:
+            return
+        with self._pending_lock:
+            self._pending.append((time.monotonic() + delay, [1, job_path, unit, result]))
+
+    def process(self) -> _Message:
+        with self._pending_lock:
+            due = [p for p in self._pending if p[0] <= time.monotonic()]
+            if not due:
+                return _Message()
+            self._pending.remove(due[0])
+        self.on_job_removed(_Message(due[0][1]))
+        return _Message(due[0][1])
+
+
+class _FakeManagerInterface:
+    def __init__(self, bus: _FakeBus, results: dict[bytes, bytes | None]):
+        self._bus = bus
+        self._results = results
+        self._jobs = 0
+        self.subscribed = False
+        self.calls: list[tuple[str, bytes, bytes]] = []
+
+    def Subscribe(self) -> None:
+        self.subscribed = True
+
+    def _queue(self, method: str, unit: bytes, mode: bytes) -> bytes:
+        self.calls.append((method, unit, mode))
+        self._jobs += 1
+        job_path = b"/org/freedesktop/systemd1/job/%d" % self._jobs
+        self._bus.queue_job(job_path, unit, self._results.get(unit, b"done"), delay=0.05)
+        return job_path
+
+    def StartUnit(self, unit: bytes, mode: bytes) -> bytes:
+        return self._queue("StartUnit", unit, mode)
+
+    def StopUnit(self, unit: bytes, mode: bytes) -> bytes:
+        return self._queue("StopUnit", unit, mode)
+
+    def RestartUnit(self, unit: bytes, mode: bytes) -> bytes:
+        return self._queue("RestartUnit", unit, mode)
+
+
+class SystemdBusClientTest(unittest.TestCase):
+    def setUp(self):
+        self.bus = _FakeBus()
+        self.addCleanup(os.close, self.bus._read_fd)
+        self.addCleanup(os.close, self.bus._write_fd)
+        self.results: dict[bytes, bytes | None] = {}
+        self.manager = _FakeManagerInterface(self.bus, self.results)
+
+        class Manager:
+            def __init__(inner, bus, _autoload):
+                self.assertIs(bus, self.bus)
+                inner.Manager = self.manager
+
+        patches = [
+            mock.patch.object(helper, "DBus", lambda: self.bus, create=True),
+            mock.patch.object(helper, "Manager", Manager, create=True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.client = helper.SystemdBusClient()
+
+    def test_successful_job(self):
+        out = self.client.run_action("restart", "nginx", timeout=5)
+        self.assertEqual(out, {"ok": True, "return_code": 0, "stdout": "", "stderr": ""})
+        self.assertTrue(self.manager.subscribed)
+        self.assertEqual(self.bus.match[3], b"JobRemoved")
+        self.assertEqual(self.manager.calls, [("RestartUnit", b"nginx.service", b"replace")])
+        self.assertEqual(self.client._job_results, {})
+
+    def test_failed_job(self):
+        self.results[b"broken.service"] = b"failed"
+        out = self.client.run_action("start", "broken", timeout=5)
+        self.assertFalse(out["ok"])
+        self.assertEqual(out["return_code"], 1)
+        self.assertEqual(out["stderr"], "Job for broken.service finished with result 'failed'.")
+
+    def test_job_timeout(self):
+        self.results[b"hung.service"] = None
+        started = time.monotonic()
+        out = self.client.run_action("stop", "hung", timeout=0.3)
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(out["stderr"], "Command timed out after 0.3s")
+        self.assertFalse(out["ok"])
+        self.assertEqual(self.client._job_results, {})
+
+    def test_concurrent_jobs_share_the_bus(self):
+        self.results[b"bad.service"] = b"failed"
+        out = {}
+        threads = [
+            threading.Thread(target=lambda t=t: out.__setitem__(t, self.client.run_action("start", t, timeout=5)))
+            for t in ("good", "bad")
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue(out["good"]["ok"])
+        self.assertFalse(out["bad"]["ok"])
+        self.assertEqual(len(self.manager.calls), 2)
+
+    def test_bus_error_resets_connection(self):
+        def fail(*_args):
+            raise RuntimeError("Access denied")
+
+        self.manager.StartUnit = fail
+        out = self.client.run_action("start", "nginx", timeout=5)
+        self.assertEqual(out["stderr"], "Access denied")
+        self.assertTrue(self.bus.closed)
+        self.assertIsNone(self.client._manager)
+
+
+if __name__ == "__main__":
+    unittest.main()